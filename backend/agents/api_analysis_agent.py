@@ -11,8 +11,42 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
+from .utils import endpoint_name_parts, to_class_name
+
 logger = logging.getLogger(__name__)
 
+# Per-endpoint method templates for the generated clients, built once at import
+_PY_METHOD_TEMPLATE = "\n".join(
+    [
+        "    async def {name}(self, {params}) -> Dict[str, Any]:",
+        '        """',
+        "        {description}",
+        "        ",
+        "        Endpoint: {method} {path}",
+        '        """',
+        '        url = f"{{self.base_url}}{path}"',
+        "        response = await self.client.{method_lower}(",
+        "            url,",
+        "            headers=self._get_headers(),",
+        "        )",
+        "        response.raise_for_status()",
+        "        return response.json()",
+        "",
+    ]
+)
+
+_TS_METHOD_TEMPLATE = "\n".join(
+    [
+        "  async {name}({params}): Promise<any> {{",
+        "    const response = await this.client.{method_lower}(",
+        "      `{path}`",
+        "    );",
+        "    return response.data;",
+        "  }}",
+        "",
+    ]
+)
+
 
 class APIEndpoint(BaseModel):
     """Model for an API endpoint"""
@@ -135,7 +169,7 @@ class APIAnalysisAgent:
             "from typing import Any, Dict, List, Optional",
             "",
             "",
-            f"class {self._to_class_name(self.site_name)}Client:",
+            f"class {to_class_name(self.site_name)}Client:",
             f'    """API Client for {self.site_name}"""',
             "",
             "    def __init__(self, base_url: str, api_key: Optional[str] = None):",
@@ -162,23 +196,15 @@ class APIAnalysisAgent:
                 method_name = self._generate_method_name(endpoint)
                 params = self._extract_parameters(endpoint)
 
-                lines.extend(
-                    [
-                        f"    async def {method_name}(self, {params}) -> Dict[str, Any]:",
-                        f'        """',
-                        f"        {endpoint.get('description', 'API call')}",
-                        f"        ",
-                        f"        Endpoint: {endpoint.get('method', 'GET')} {endpoint.get('path', '')}",
-                        f'        """',
-                        f"        url = f\"{{self.base_url}}{endpoint.get('path', '')}\"",
-                        f"        response = await self.client.{endpoint.get('method', 'get').lower()}(",
-                        f"            url,",
-                        f"            headers=self._get_headers(),",
-                        f"        )",
-                        f"        response.raise_for_status()",
-                        f"        return response.json()",
-                        "",
-                    ]
+                lines.append(
+                    _PY_METHOD_TEMPLATE.format(
+                        name=method_name,
+                        params=params,
+                        description=endpoint.get("description", "API call"),
+                        method=endpoint.get("method", "GET"),
+                        method_lower=endpoint.get("method", "get").lower(),
+                        path=endpoint.get("path", ""),
+                    )
                 )
 
         lines.extend(
@@ -208,7 +234,7 @@ class APIAnalysisAgent:
             "  status: number;",
             "}",
             "",
-            f"export class {self._to_class_name(self.site_name)}Client {{",
+            f"export class {to_class_name(self.site_name)}Client {{",
             "  private client: AxiosInstance;",
             "",
             "  constructor(private baseUrl: string, private apiKey?: string) {",
@@ -232,16 +258,13 @@ class APIAnalysisAgent:
                 method_name = self._generate_method_name(endpoint)
                 params = self._extract_parameters_typescript(endpoint)
 
-                lines.extend(
-                    [
-                        f"  async {method_name}({params}): Promise<any> {{",
-                        f"    const response = await this.client.{endpoint.get('method', 'get').lower()}(",
-                        f"      `{endpoint.get('path', '')}`",
-                        f"    );",
-                        f"    return response.data;",
-                        f"  }}",
-                        "",
-                    ]
+                lines.append(
+                    _TS_METHOD_TEMPLATE.format(
+                        name=method_name,
+                        params=params,
+                        method_lower=endpoint.get("method", "get").lower(),
+                        path=endpoint.get("path", ""),
+                    )
                 )
 
         lines.append("}")
@@ -319,24 +342,13 @@ class APIAnalysisAgent:
 
         return collection
 
-    def _to_class_name(self, name: str) -> str:
-        """Convert site name to class name"""
-        return "".join(word.capitalize() for word in name.split("_"))
-
     def _generate_method_name(self, endpoint: Dict[str, Any]) -> str:
         """Generate method name from endpoint"""
-        path = endpoint.get("path", "")
-        method = endpoint.get("method", "get").lower()
+        method, name = endpoint_name_parts(endpoint)
 
-        # Extract meaningful parts from path
-        parts = [p for p in path.split("/") if p and not p.startswith("{")]
-
-        if not parts:
+        if name is None:
             return f"{method}_data"
 
-        # Use last meaningful part
-        name = parts[-1].replace("-", "_")
-
         # Prefix with HTTP method
         if method == "get" and name.endswith("s"):
             return f"get_{name}"
@@ -9,8 +9,31 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List
 
+from .utils import endpoint_name_parts, to_class_name
+
 logger = logging.getLogger(__name__)
 
+# Per-endpoint tool method template, built once at import
+_TOOL_METHOD_TEMPLATE = "\n".join(
+    [
+        "    async def {name}(self, **kwargs) -> Dict[str, Any]:",
+        '        """',
+        "        {description}",
+        "        ",
+        "        Endpoint: {method} {path}",
+        '        """',
+        '        url = f"{{self.base_url}}{path}"',
+        "        response = await self.client.{method_lower}(",
+        "            url,",
+        "            headers=self._get_headers(),",
+        "            params=kwargs,",
+        "        )",
+        "        response.raise_for_status()",
+        "        return response.json()",
+        "",
+    ]
+)
+
 
 class MCPServerAgent:
     """
@@ -84,7 +107,7 @@ class MCPServerAgent:
     ) -> str:
         """Generate main MCP server code"""
 
-        class_name = self._to_class_name(self.site_name)
+        class_name = to_class_name(self.site_name)
 
         code = f'''"""
 MCP Server for {self.site_name}
@@ -170,7 +193,7 @@ if __name__ == "__main__":
     def _generate_tools_code(self, endpoints: List[Dict[str, Any]]) -> str:
         """Generate tools implementation"""
 
-        class_name = self._to_class_name(self.site_name)
+        class_name = to_class_name(self.site_name)
 
         lines = [
             '"""',
@@ -204,24 +227,14 @@ if __name__ == "__main__":
         for endpoint in endpoints[:10]:  # Limit to first 10 for now
             method_name = self._generate_tool_name(endpoint)
 
-            lines.extend(
-                [
-                    f"    async def {method_name}(self, **kwargs) -> Dict[str, Any]:",
-                    f'        """',
-                    f"        {endpoint.get('description', 'API call')}",
-                    f"        ",
-                    f"        Endpoint: {endpoint.get('method', 'GET')} {endpoint.get('path', '')}",
-                    f'        """',
-                    f"        url = f\"{{self.base_url}}{endpoint.get('path', '')}\"",
-                    f"        response = await self.client.{endpoint.get('method', 'get').lower()}(",
-                    f"            url,",
-                    f"            headers=self._get_headers(),",
-                    f"            params=kwargs,",
-                    f"        )",
-                    f"        response.raise_for_status()",
-                    f"        return response.json()",
-                    "",
-                ]
+            lines.append(
+                _TOOL_METHOD_TEMPLATE.format(
+                    name=method_name,
+                    description=endpoint.get("description", "API call"),
+                    method=endpoint.get("method", "GET"),
+                    method_lower=endpoint.get("method", "get").lower(),
+                    path=endpoint.get("path", ""),
+                )
             )
 
         lines.extend(
@@ -337,22 +350,11 @@ To regenerate, run the site investigation workflow again.
 MIT
 """
 
-    def _to_class_name(self, name: str) -> str:
-        """Convert site name to class name"""
-        return "".join(word.capitalize() for word in name.split("_"))
-
     def _generate_tool_name(self, endpoint: Dict[str, Any]) -> str:
         """Generate tool name from endpoint"""
-        path = endpoint.get("path", "")
-        method = endpoint.get("method", "get").lower()
-
-        # Extract meaningful parts from path
-        parts = [p for p in path.split("/") if p and not p.startswith("{")]
+        method, name = endpoint_name_parts(endpoint)
 
-        if not parts:
+        if name is None:
             return f"{method}_data"
 
-        # Use last meaningful part
-        name = parts[-1].replace("-", "_")
-
         return f"{method}_{name}"
@@ -8,8 +8,41 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List
 
+from .utils import to_class_name
+
 logger = logging.getLogger(__name__)
 
+# Python type name -> TypeScript / JSON Schema / Prisma type, used by the converters below
+_TYPESCRIPT_TYPES = {
+    "str": "string",
+    "int": "number",
+    "float": "number",
+    "bool": "boolean",
+    "datetime": "Date",
+    "Dict[str, Any]": "Record<string, any>",
+    "List[Dict[str, Any]]": "Array<Record<string, any>>",
+}
+
+_JSON_SCHEMA_TYPES = {
+    "str": "string",
+    "int": "integer",
+    "float": "number",
+    "bool": "boolean",
+    "datetime": "string",
+    "Dict[str, Any]": "object",
+    "List[Dict[str, Any]]": "array",
+}
+
+_PRISMA_TYPES = {
+    "str": "String",
+    "int": "Int",
+    "float": "Float",
+    "bool": "Boolean",
+    "datetime": "DateTime",
+    "Dict[str, Any]": "Json",
+    "List[Dict[str, Any]]": "Json",
+}
+
 
 class SchemaGeneratorAgent:
     """
@@ -104,7 +137,7 @@ class SchemaGeneratorAgent:
         entities = self._extract_entities(endpoints)
 
         for entity_name, fields in entities.items():
-            class_name = self._to_class_name(entity_name)
+            class_name = to_class_name(entity_name)
 
             lines.extend(
                 [
@@ -140,7 +173,7 @@ class SchemaGeneratorAgent:
         entities = self._extract_entities(endpoints)
 
         for entity_name, fields in entities.items():
-            interface_name = self._to_class_name(entity_name)
+            interface_name = to_class_name(entity_name)
 
             lines.extend(
                 [
@@ -212,7 +245,7 @@ class SchemaGeneratorAgent:
         entities = self._extract_entities(endpoints)
 
         for entity_name, fields in entities.items():
-            model_name = self._to_class_name(entity_name)
+            model_name = to_class_name(entity_name)
 
             lines.extend(
                 [
@@ -284,63 +317,29 @@ class SchemaGeneratorAgent:
 
         return entities
 
-    def _to_class_name(self, name: str) -> str:
-        """Convert name to PascalCase"""
-        return "".join(word.capitalize() for word in name.split("_"))
-
     def _python_type_to_typescript(self, py_type: str) -> str:
         """Convert Python type to TypeScript type"""
-        type_map = {
-            "str": "string",
-            "int": "number",
-            "float": "number",
-            "bool": "boolean",
-            "datetime": "Date",
-            "Dict[str, Any]": "Record<string, any>",
-            "List[Dict[str, Any]]": "Array<Record<string, any>>",
-        }
-
         # Handle Optional types
         if py_type.startswith("Optional["):
             inner_type = py_type[9:-1]  # Extract type from Optional[...]
             return self._python_type_to_typescript(inner_type) + " | null"
 
-        return type_map.get(py_type, "any")
+        return _TYPESCRIPT_TYPES.get(py_type, "any")
 
     def _python_type_to_json(self, py_type: str) -> str:
         """Convert Python type to JSON Schema type"""
-        type_map = {
-            "str": "string",
-            "int": "integer",
-            "float": "number",
-            "bool": "boolean",
-            "datetime": "string",
-            "Dict[str, Any]": "object",
-            "List[Dict[str, Any]]": "array",
-        }
-
         # Handle Optional types
         if py_type.startswith("Optional["):
             inner_type = py_type[9:-1]
             return self._python_type_to_json(inner_type)
 
-        return type_map.get(py_type, "string")
+        return _JSON_SCHEMA_TYPES.get(py_type, "string")
 
     def _python_type_to_prisma(self, py_type: str) -> str:
         """Convert Python type to Prisma type"""
-        type_map = {
-            "str": "String",
-            "int": "Int",
-            "float": "Float",
-            "bool": "Boolean",
-            "datetime": "DateTime",
-            "Dict[str, Any]": "Json",
-            "List[Dict[str, Any]]": "Json",
-        }
-
         # Handle Optional types
         if py_type.startswith("Optional["):
             inner_type = py_type[9:-1]
             return self._python_type_to_prisma(inner_type)
 
-        return type_map.get(py_type, "String")
+        return _PRISMA_TYPES.get(py_type, "String")
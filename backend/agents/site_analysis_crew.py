@@ -18,6 +18,7 @@ if str(backend_dir) not in sys.path:
 from agents.api_analysis_agent import APIAnalysisAgent
 from agents.mcp_server_agent import MCPServerAgent
 from agents.schema_generator_agent import SchemaGeneratorAgent
+from agents.utils import to_class_name
 from site_investigator import SiteInvestigator
 
 logger = logging.getLogger(__name__)
@@ -269,9 +270,9 @@ class SiteAnalysisCrew:
                 "### Using Python Client",
                 "",
                 "```python",
-                f"from {self.site_name}_api import {self._to_class_name(self.site_name)}Client",
+                f"from {self.site_name}_api import {to_class_name(self.site_name)}Client",
                 "",
-                f"client = {self._to_class_name(self.site_name)}Client(",
+                f"client = {to_class_name(self.site_name)}Client(",
                 f'    base_url="{self.site_url}",',
                 "    api_key=os.getenv('API_KEY')  # If required",
                 ")",
@@ -307,10 +308,6 @@ class SiteAnalysisCrew:
 
         return "\n".join(lines)
 
-    def _to_class_name(self, name: str) -> str:
-        """Convert name to PascalCase"""
-        return "".join(word.capitalize() for word in name.split("_"))
-
 
 # Example usage for ShopGoodwill
 async def analyze_shopgoodwill():
@@ -0,0 +1,32 @@
+"""
+Shared naming helpers for the code-generating agents
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+
+@lru_cache(maxsize=None)
+def to_class_name(name: str) -> str:
+    """Convert a snake_case name to PascalCase"""
+    return "".join(word.capitalize() for word in name.split("_"))
+
+
+def endpoint_name_parts(endpoint: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    """
+    Split an endpoint into its lowercase HTTP method and the last meaningful
+    path segment (path parameters skipped, dashes converted to underscores).
+
+    The segment is None when the path has no meaningful parts.
+    """
+    path = endpoint.get("path", "")
+    method = endpoint.get("method", "get").lower()
+
+    # Extract meaningful parts from path
+    parts = [p for p in path.split("/") if p and not p.startswith("{")]
+
+    if not parts:
+        return method, None
+
+    # Use last meaningful part
+    return method, parts[-1].replace("-", "_")
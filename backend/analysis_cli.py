@@ -7,6 +7,7 @@ Provides comprehensive tools for price adjustments, metadata management, and ite
 
 import argparse
 import json
+import re
 import sys
 from datetime import datetime
 from decimal import Decimal
@@ -23,6 +24,19 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+# Specification patterns for MetadataManager._extract_specifications, compiled once
+_SPEC_PATTERNS = tuple(
+    (key, re.compile(pattern))
+    for key, pattern in (
+        ("year", r"(19|20)\d{2}"),
+        ("size", r'(\d+)\s*(gb|tb|mb|inch|"|\')'),
+        ("model", r"model\s+([a-z0-9-]+)"),
+        ("brand", r"(samsung|apple|sony|dell|hp|lenovo|microsoft)"),
+        ("color", r"(black|white|silver|blue|red|gold|gray|grey)"),
+        ("condition", r"(new|used|refurbished|excellent|good|fair)"),
+    )
+)
+
 
 class PriceAnalyzer:
     """Advanced price analysis and adjustment engine."""
@@ -57,6 +71,34 @@ class PriceAnalyzer:
         "side": 0.9,
     }
 
+    SEVERITY_MULTIPLIERS = {
+        "minor": Decimal("0.5"),
+        "moderate": Decimal("1.0"),
+        "major": Decimal("1.5"),
+        "severe": Decimal("2.0"),
+    }
+
+    SEASONAL_FACTORS = {
+        "winter_gear": {
+            12: 1.3,
+            1: 1.3,
+            2: 1.2,  # High demand in winter
+            6: 0.8,
+            7: 0.8,
+            8: 0.8,  # Low demand in summer
+        },
+        "summer_gear": {
+            6: 1.3,
+            7: 1.3,
+            8: 1.2,  # High demand in summer
+            12: 0.8,
+            1: 0.8,
+            2: 0.8,  # Low demand in winter
+        },
+        "back_to_school": {7: 1.15, 8: 1.2, 9: 1.1},
+        "holiday_items": {11: 1.3, 12: 1.4},
+    }
+
     def calculate_linear_depreciation(
         self, base_price: Decimal, age_years: Decimal, rate: Decimal = Decimal("0.10")
     ) -> Decimal:
@@ -107,12 +149,7 @@ class PriceAnalyzer:
         damage_mult = Decimal(str(self.DAMAGE_TYPE_MULTIPLIERS.get(damage_type.lower(), 1.0)))
         location_mult = Decimal(str(self.LOCATION_MULTIPLIERS.get(location.lower(), 1.0)))
 
-        severity_mult = {
-            "minor": Decimal("0.5"),
-            "moderate": Decimal("1.0"),
-            "major": Decimal("1.5"),
-            "severe": Decimal("2.0"),
-        }.get(severity.lower(), Decimal("1.0"))
+        severity_mult = self.SEVERITY_MULTIPLIERS.get(severity.lower(), Decimal("1.0"))
 
         total_adjustment = base_adjustment * damage_mult * location_mult * severity_mult
         adjusted_price = base_price * (Decimal("1") + total_adjustment)
@@ -149,28 +186,7 @@ class PriceAnalyzer:
         self, base_price: Decimal, item_category: str, current_month: int
     ) -> Decimal:
         """Calculate seasonal price adjustments."""
-        seasonal_factors = {
-            "winter_gear": {
-                12: 1.3,
-                1: 1.3,
-                2: 1.2,  # High demand in winter
-                6: 0.8,
-                7: 0.8,
-                8: 0.8,  # Low demand in summer
-            },
-            "summer_gear": {
-                6: 1.3,
-                7: 1.3,
-                8: 1.2,  # High demand in summer
-                12: 0.8,
-                1: 0.8,
-                2: 0.8,  # Low demand in winter
-            },
-            "back_to_school": {7: 1.15, 8: 1.2, 9: 1.1},
-            "holiday_items": {11: 1.3, 12: 1.4},
-        }
-
-        factor = seasonal_factors.get(item_category, {}).get(current_month, 1.0)
+        factor = self.SEASONAL_FACTORS.get(item_category, {}).get(current_month, 1.0)
         return base_price * Decimal(str(factor))
 
     def calculate_comprehensive_price(
@@ -351,23 +367,11 @@ class MetadataManager:
     @staticmethod
     def _extract_specifications(title: str, description: str) -> Dict[str, str]:
         """Extract specifications from text."""
-        import re
-
         specs = {}
         text = f"{title} {description}".lower()
 
-        # Common patterns
-        patterns = {
-            "year": r"(19|20)\d{2}",
-            "size": r'(\d+)\s*(gb|tb|mb|inch|"|\')',
-            "model": r"model\s+([a-z0-9-]+)",
-            "brand": r"(samsung|apple|sony|dell|hp|lenovo|microsoft)",
-            "color": r"(black|white|silver|blue|red|gold|gray|grey)",
-            "condition": r"(new|used|refurbished|excellent|good|fair)",
-        }
-
-        for key, pattern in patterns.items():
-            match = re.search(pattern, text)
+        for key, pattern in _SPEC_PATTERNS:
+            match = pattern.search(text)
             if match:
                 specs[key] = match.group(0)
 
@@ -211,36 +211,41 @@ def get_statistics() -> Dict[str, Any]:
 
     stats = {}
 
-    # Total listings
-    stats["total_listings"] = c.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+    # Totals, price statistics and the last-24-hours count in one scan of listings
+    import time
+
+    day_ago = time.time() - 86400
+    total, avg_price, min_price, max_price, recent = c.execute(
+        """
+        SELECT COUNT(*),
+               AVG(CASE WHEN price > 0 THEN price END),
+               MIN(CASE WHEN price > 0 THEN price END),
+               MAX(CASE WHEN price > 0 THEN price END),
+               COALESCE(SUM(ts > ?), 0)
+        FROM listings
+        """,
+        (day_ago,),
+    ).fetchone()
+
+    stats["total_listings"] = total
 
     # Listings by source
     stats["by_source"] = {}
     for row in c.execute("SELECT source, COUNT(*) FROM listings GROUP BY source"):
         stats["by_source"][row[0]] = row[1]
 
-    # Price statistics
-    price_stats = c.execute(
-        "SELECT AVG(price), MIN(price), MAX(price) FROM listings WHERE price > 0"
-    ).fetchone()
-
-    if price_stats and price_stats[0]:
+    if avg_price:
         stats["price_stats"] = {
-            "average": round(price_stats[0], 2),
-            "min": round(price_stats[1], 2),
-            "max": round(price_stats[2], 2),
+            "average": round(avg_price, 2),
+            "min": round(min_price, 2),
+            "max": round(max_price, 2),
         }
 
     # Total comps
     stats["total_comps"] = c.execute("SELECT COUNT(*) FROM comps").fetchone()[0]
 
     # Recent listings (last 24 hours)
-    import time
-
-    day_ago = time.time() - 86400
-    stats["recent_listings"] = c.execute(
-        "SELECT COUNT(*) FROM listings WHERE ts > ?", (day_ago,)
-    ).fetchone()[0]
+    stats["recent_listings"] = recent
 
     conn.close()
     return stats
@@ -6,6 +6,7 @@ import argparse
 import asyncio
 import json
 import logging
+import os
 import re
 import sqlite3
 import sys
@@ -14,7 +15,7 @@ from collections import defaultdict
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import httpx
 from rapidfuzz import fuzz
@@ -28,6 +29,13 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 APP_NAME = "ArbFinder"
 DEFAULT_UA = f"{APP_NAME}/0.2 (+https://cloudcurio.cc)"
 DEFAULT_DB_PATH = str(Path.home() / ".arb_finder.sqlite3")
@@ -37,8 +45,33 @@ MAX_CONCURRENCY = 6
 RETRY_BASE = 0.6
 RETRY_MAX = 3
 RATE_LIMIT_SECONDS = 1.0
+# Durability-free PRAGMAs applied when ARBF_TEST_FAST_DB=1 (test suites only)
+FAST_DB_PRAGMAS = ("journal_mode=MEMORY", "synchronous=OFF", "temp_store=MEMORY")
+
+# Absolute path -> (st_dev, st_ino) of each database file db_init has set up in this process
+_initialized_dbs: Dict[str, Tuple[int, int]] = {}
 
 _price_re = re.compile(r"([\$£€])\s*([0-9]+(?:[\.,][0-9]{2})?)")
+_tag_re = re.compile(r"<.*?>")
+_ws_re = re.compile(r"\s+")
+_currency_by_symbol = {"$": "USD", "£": "GBP", "€": "EUR"}
+
+# Provider scraping patterns, compiled once instead of per result block
+_ebay_block_re = re.compile(r"<li class=\\\"s-item[\\s\\S]*?>")
+_ebay_title_re = re.compile(r"s-item__title\\\">(.*?)<")
+_ebay_price_re = re.compile(r"s-item__price\\\">(.*?)<")
+_ebay_url_re = re.compile(r"href=\\\"(https?://www.ebay.com/itm/[^\"]+)\\\"")
+_sgw_title_re = re.compile(r"product-title[\\s\\S]*?>(.*?)<")
+_sgw_url_re = re.compile(r"href=\\\"(/item/[^\"]+)\\\"")
+_sgw_price_re = re.compile(r"Current Bid[\\s\\S]*?\\$([0-9]+(?:\\.[0-9]{2})?)")
+_govdeals_block_re = re.compile(r"<div class=\\\"auction-card[\\s\\S]*?>")
+_govdeals_title_re = re.compile(r"item-title[\\s\\S]*?>(.*?)<")
+_govdeals_url_re = re.compile(r"href=\\\"(/index\\\\.cfm\\?fa=Main\\\\.Item&itemid[^\"]+)\\\"")
+_govdeals_price_re = re.compile(r"Current Bid:\\s*\\$([0-9]+(?:\\.[0-9]{2})?)")
+_gsurplus_block_re = re.compile(r"<div class=\\\"result-card[\\s\\S]*?>")
+_gsurplus_title_re = re.compile(r"<h3[\\s\\S]*?>(.*?)<")
+_gsurplus_url_re = re.compile(r"href=\\\"(https?://[^\"]+)\\\"")
+_gsurplus_price_re = re.compile(r"\\$([0-9]+(?:\\.[0-9]{2})?)")
 
 
 @dataclass
@@ -82,16 +115,42 @@ except Exception as e:
     logger.warning("File logger init failed: %s", e)
 
 
+def install_event_loop_policy() -> bool:
+    """Use uvloop for asyncio when it is installed; returns True if installed."""
+    if not UVLOOP_AVAILABLE:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 @contextmanager
 def sqlite_conn(db_path: str):
     conn = sqlite3.connect(db_path)
+    if os.environ.get("ARBF_TEST_FAST_DB") == "1":
+        # Throwaway test databases don't need fsyncs on every commit
+        for pragma in FAST_DB_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
     try:
         yield conn
     finally:
         conn.close()
 
 
+def _file_identity(path: str) -> Optional[Tuple[int, int]]:
+    """Return (st_dev, st_ino) for *path*, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
 def db_init(db_path: str) -> None:
+    """Create the listings and comps tables, once per database file per process."""
+    key = os.path.abspath(db_path)
+    # A deleted, replaced or never-created file needs its schema again even if seen before
+    if key in _initialized_dbs and _file_identity(key) == _initialized_dbs[key]:
+        return
     with sqlite_conn(db_path) as conn:
         c = conn.cursor()
         c.execute("""
@@ -108,12 +167,15 @@ def db_init(db_path: str) -> None:
             );
             """)
         conn.commit()
+    identity = _file_identity(key)
+    if identity is not None:
+        _initialized_dbs[key] = identity
 
 
-def db_upsert_listing(db_path: str, listing: Listing) -> None:
+def db_upsert_listings(db_path: str, listings: Iterable[Listing]) -> None:
+    """Upsert *listings* with one prepared statement in a single transaction."""
     with sqlite_conn(db_path) as conn:
-        c = conn.cursor()
-        c.execute(
+        conn.executemany(
             """
             INSERT INTO listings (source,url,title,price,currency,condition,ts,meta_json)
             VALUES (?,?,?,?,?,?,?,?)
@@ -122,23 +184,31 @@ def db_upsert_listing(db_path: str, listing: Listing) -> None:
               condition=excluded.condition, ts=excluded.ts, meta_json=excluded.meta_json;
             """,
             (
-                listing.source,
-                listing.url,
-                listing.title,
-                listing.price,
-                listing.currency,
-                listing.condition,
-                listing.timestamp,
-                json.dumps(listing.meta) if listing.meta else "{}",
+                (
+                    listing.source,
+                    listing.url,
+                    listing.title,
+                    listing.price,
+                    listing.currency,
+                    listing.condition,
+                    listing.timestamp,
+                    json.dumps(listing.meta) if listing.meta else "{}",
+                )
+                for listing in listings
             ),
         )
         conn.commit()
 
 
-def db_upsert_comp(db_path: str, comp: Comp) -> None:
+def db_upsert_listing(db_path: str, listing: Listing) -> None:
+    db_upsert_listings(db_path, (listing,))
+
+
+def db_upsert_comps(db_path: str, comps: Iterable[Comp]) -> None:
+    """Upsert *comps* with one prepared statement in a single transaction."""
+    now = time.time()
     with sqlite_conn(db_path) as conn:
-        c = conn.cursor()
-        c.execute(
+        conn.executemany(
             """
             INSERT INTO comps (key_title,avg_price,median_price,count,ts)
             VALUES (?,?,?,?,?)
@@ -146,11 +216,18 @@ def db_upsert_comp(db_path: str, comp: Comp) -> None:
               avg_price=excluded.avg_price, median_price=excluded.median_price,
               count=excluded.count, ts=excluded.ts;
             """,
-            (comp.key_title, comp.avg_price, comp.median_price, comp.count, time.time()),
+            (
+                (comp.key_title, comp.avg_price, comp.median_price, comp.count, now)
+                for comp in comps
+            ),
         )
         conn.commit()
 
 
+def db_upsert_comp(db_path: str, comp: Comp) -> None:
+    db_upsert_comps(db_path, (comp,))
+
+
 class PoliteClient:
     def __init__(self, ua: str = DEFAULT_UA, timeout: float = HTTP_TIMEOUT):
         self._client = httpx.AsyncClient(
@@ -211,20 +288,20 @@ class EbaySoldComps(Provider):
     async def search(self, query: str, limit: int = 120):
         html = (await self.client.get(self._url(query))).text
         items: List[Listing] = []
-        for block in re.split(r"<li class=\\\"s-item[\\s\\S]*?>", html)[1:]:
-            m_title = re.search(r"s-item__title\\\">(.*?)<", block)
-            m_price = re.search(r"s-item__price\\\">(.*?)<", block)
+        for block in _ebay_block_re.split(html)[1:]:
+            m_title = _ebay_title_re.search(block)
+            m_price = _ebay_price_re.search(block)
             if not (m_title and m_price):
                 continue
-            title_raw = re.sub(r"<.*?>", "", m_title.group(1)).strip()
-            m_price_text = re.sub(r"<.*?>", " ", m_price.group(1))
+            title_raw = _tag_re.sub("", m_title.group(1)).strip()
+            m_price_text = _tag_re.sub(" ", m_price.group(1))
             price_parsed = _price_re.search(m_price_text.replace(",", ""))
             if not price_parsed:
                 continue
             sym, amt = price_parsed.group(1), price_parsed.group(2)
             price = float(amt)
-            currency = {"$": "USD", "£": "GBP", "€": "EUR"}.get(sym, "USD")
-            m_url = re.search(r"href=\\\"(https?://www.ebay.com/itm/[^\"]+)\\\"", block)
+            currency = _currency_by_symbol.get(sym, "USD")
+            m_url = _ebay_url_re.search(block)
             url_item = m_url.group(1) if m_url else self._url(query)
             items.append(
                 Listing(self.name, url_item, title_raw, price, currency, "sold", meta={"q": query})
@@ -247,12 +324,12 @@ class ShopGoodwillLive(Provider):
         while len(items) < limit and page <= 3:
             html = (await self.client.get(self._url(query, page))).text
             for card in html.split("product-card"):
-                m_title = re.search(r"product-title[\\s\\S]*?>(.*?)<", card)
-                m_url = re.search(r"href=\\\"(/item/[^\"]+)\\\"", card)
-                m_price = re.search(r"Current Bid[\\s\\S]*?\\$([0-9]+(?:\\.[0-9]{2})?)", card)
+                m_title = _sgw_title_re.search(card)
+                m_url = _sgw_url_re.search(card)
+                m_price = _sgw_price_re.search(card)
                 if not (m_title and m_url and m_price):
                     continue
-                title = re.sub(r"<.*?>", "", m_title.group(1)).strip()
+                title = _tag_re.sub("", m_title.group(1)).strip()
                 url_item = httpx.URL("https://shopgoodwill.com").join(m_url.group(1)).human_repr()
                 try:
                     price = float(m_price.group(1))
@@ -287,15 +364,13 @@ class GovDealsLive(Provider):
         page = 1
         while len(items) < limit and page <= 2:
             html = (await self.client.get(self._url(query, page))).text
-            for block in re.split(r"<div class=\\\"auction-card[\\s\\S]*?>", html)[1:]:
-                m_title = re.search(r"item-title[\\s\\S]*?>(.*?)<", block)
-                m_url = re.search(
-                    r"href=\\\"(/index\\\\.cfm\\?fa=Main\\\\.Item&itemid[^\"]+)\\\"", block
-                )
-                m_price = re.search(r"Current Bid:\\s*\\$([0-9]+(?:\\.[0-9]{2})?)", block)
+            for block in _govdeals_block_re.split(html)[1:]:
+                m_title = _govdeals_title_re.search(block)
+                m_url = _govdeals_url_re.search(block)
+                m_price = _govdeals_price_re.search(block)
                 if not (m_title and m_url and m_price):
                     continue
-                title = re.sub(r"<.*?>", "", m_title.group(1)).strip()
+                title = _tag_re.sub("", m_title.group(1)).strip()
                 url_item = httpx.URL("https://www.govdeals.com").join(m_url.group(1)).human_repr()
                 try:
                     price = float(m_price.group(1))
@@ -330,13 +405,13 @@ class GovernmentSurplusLive(Provider):
         page = 1
         while len(items) < limit and page <= 2:
             html = (await self.client.get(self._url(query, page))).text
-            for block in re.split(r"<div class=\\\"result-card[\\s\\S]*?>", html)[1:]:
-                m_title = re.search(r"<h3[\\s\\S]*?>(.*?)<", block)
-                m_url = re.search(r"href=\\\"(https?://[^\"]+)\\\"", block)
-                m_price = re.search(r"\\$([0-9]+(?:\\.[0-9]{2})?)", block)
+            for block in _gsurplus_block_re.split(html)[1:]:
+                m_title = _gsurplus_title_re.search(block)
+                m_url = _gsurplus_url_re.search(block)
+                m_price = _gsurplus_price_re.search(block)
                 if not (m_title and m_url and m_price):
                     continue
-                title = re.sub(r"<.*?>", "", m_title.group(1)).strip()
+                title = _tag_re.sub("", m_title.group(1)).strip()
                 url_item = m_url.group(1)
                 price = float(m_price.group(1))
                 items.append(
@@ -429,7 +504,7 @@ def compute_comps(listings: List[Listing], sim_threshold: int = 86) -> Dict[str,
     bins: Dict[str, List[float]] = defaultdict(list)
     exemplars: List[str] = []
     for lst in listings:
-        nt = re.sub(r"\s+", " ", lst.title).strip().lower()
+        nt = _ws_re.sub(" ", lst.title).strip().lower()
         chosen = None
         for key in exemplars:
             if fuzz.token_set_ratio(nt, key) >= sim_threshold:
@@ -455,7 +530,7 @@ def match_comps_to_live(
     rows: List[Dict[str, Any]] = []
     comp_keys = list(comps.keys())
     for lst in live:
-        nt = re.sub(r"\s+", " ", lst.title).strip().lower()
+        nt = _ws_re.sub(" ", lst.title).strip().lower()
         best_key, best_score = None, -1
         for key in comp_keys:
             s = fuzz.token_set_ratio(nt, key)
@@ -557,13 +632,11 @@ async def run_arbfinder(args: argparse.Namespace) -> List[Dict[str, Any]]:
         progress.update(task1, completed=len(sold))
 
     logger.info("Found %d sold listings", len(sold))
-    for lst in sold:
-        db_upsert_listing(args.db, lst)
+    db_upsert_listings(args.db, sold)
 
     comps = compute_comps(sold, sim_threshold=args.sim_threshold)
     logger.info("Computed %d comparable groups", len(comps))
-    for comp in comps.values():
-        db_upsert_comp(args.db, comp)
+    db_upsert_comps(args.db, comps.values())
 
     wanted = [
         p.strip()
@@ -580,8 +653,7 @@ async def run_arbfinder(args: argparse.Namespace) -> List[Dict[str, Any]]:
             logger.info("Searching provider: %s", name)
             res = await providers[name].search(args.query, limit=args.live_limit)
             logger.info("Provider %s returned %d results", name, len(res))
-            for lst in res:
-                db_upsert_listing(args.db, lst)
+            db_upsert_listings(args.db, res)
             live.extend(res)
             if progress:
                 progress.update(task2, completed=i + 1)
@@ -723,6 +795,8 @@ def main(argv: Optional[List[str]] = None) -> int:
     if args.interactive or not args.query:
         args.interactive = True
 
+    install_event_loop_policy()
+
     # Handle watch mode
     if args.watch:
         try:
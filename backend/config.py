@@ -6,9 +6,17 @@ from __future__ import annotations
 
 import json
 import logging
+import math
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger("ArbFinder")
 
 DEFAULT_CONFIG_PATH = str(Path.home() / ".arbfinder_config.json")
@@ -38,13 +46,12 @@ def load_config(path: Optional[str] = None) -> Dict[str, Any]:
 
     try:
         if Path(config_path).exists():
-            with open(config_path, "r") as f:
-                user_config = json.load(f)
-                # Merge with defaults
-                config = DEFAULT_CONFIG.copy()
-                config.update(user_config)
-                logger.info(f"Loaded config from {config_path}")
-                return config
+            user_config = _decode_config(Path(config_path).read_bytes())
+            # Merge with defaults
+            config = DEFAULT_CONFIG.copy()
+            config.update(user_config)
+            logger.info(f"Loaded config from {config_path}")
+            return config
         else:
             logger.info(f"No config file found at {config_path}, using defaults")
             return DEFAULT_CONFIG.copy()
@@ -53,13 +60,59 @@ def load_config(path: Optional[str] = None) -> Dict[str, Any]:
         return DEFAULT_CONFIG.copy()
 
 
+def _decode_config(data: bytes) -> Dict[str, Any]:
+    """Parse a configuration file, using orjson when it is installed.
+
+    orjson rejects the NaN and Infinity literals json.dump writes, so those files are
+    parsed with json instead.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _orjson_matches_json(value: Any) -> bool:
+    """Return True if orjson serializes every number in *value* the way json.dumps does.
+
+    orjson writes NaN and Infinity as null and formats exponents differently
+    (0.00001 for 1e-05), so floats that are non-finite or use an exponent rule it out.
+    """
+    if isinstance(value, float):
+        return math.isfinite(value) and "e" not in repr(value)
+    if isinstance(value, dict):
+        return all(_orjson_matches_json(k) and _orjson_matches_json(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return all(_orjson_matches_json(v) for v in value)
+    return True
+
+
+def _encode_config(config: Dict[str, Any]) -> bytes:
+    """Serialize configuration as indented JSON, using orjson when it is installed.
+
+    orjson output is only used when it is pure ASCII (json.dumps escapes non-ASCII text)
+    and every float formats the same way; anything else, including ints wider than
+    64 bits, goes through json.dumps. The file is byte-identical on either backend.
+    """
+    if ORJSON_AVAILABLE and _orjson_matches_json(config):
+        try:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            if data.isascii():
+                return data
+    return json.dumps(config, indent=2).encode()
+
+
 def save_config(config: Dict[str, Any], path: Optional[str] = None) -> bool:
     """Save configuration to JSON file."""
     config_path = path or DEFAULT_CONFIG_PATH
 
     try:
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=2)
+        Path(config_path).write_bytes(_encode_config(config))
         logger.info(f"Saved config to {config_path}")
         return True
     except Exception as e:
@@ -71,11 +124,34 @@ def create_default_config(path: Optional[str] = None) -> bool:
     """Create a default configuration file."""
     config_path = path or DEFAULT_CONFIG_PATH
 
-    if Path(config_path).exists():
+    # Encode first so a serialization error never leaves a file behind
+    try:
+        data = _encode_config(DEFAULT_CONFIG)
+    except Exception as e:
+        logger.error(f"Failed to save config to {config_path}: {e}")
+        return False
+
+    # Exclusive create: the existence check and the open are one atomic step
+    try:
+        f = open(config_path, "xb")
+    except FileExistsError:
         logger.warning(f"Config file already exists at {config_path}")
         return False
+    except Exception as e:
+        logger.error(f"Failed to save config to {config_path}: {e}")
+        return False
+
+    try:
+        with f:
+            f.write(data)
+    except Exception as e:
+        # Remove the partial file so later calls don't report it as an existing config
+        Path(config_path).unlink(missing_ok=True)
+        logger.error(f"Failed to save config to {config_path}: {e}")
+        return False
 
-    return save_config(DEFAULT_CONFIG, config_path)
+    logger.info(f"Saved config to {config_path}")
+    return True
 
 
 def update_config(updates: Dict[str, Any], path: Optional[str] = None) -> Dict[str, Any]:
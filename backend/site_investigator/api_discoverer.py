@@ -7,29 +7,41 @@ import asyncio
 import json
 import logging
 import re
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
 import httpx
 from bs4 import BeautifulSoup
 
+from .http_client import open_client
+
 logger = logging.getLogger(__name__)
 
+# Substrings that mark a URL path as API-like
+_API_PATH_INDICATORS = ("/api/", "/v1/", "/v2/", "/rest/")
+# Keywords in descriptions or parameter names that suggest authentication
+_AUTH_KEYWORDS = ("auth", "token", "key", "bearer", "api key")
+_HTTP_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH"})
+
 
 class APIDiscoverer:
     """Discover and analyze API endpoints"""
 
-    def __init__(self, site_url: str):
+    def __init__(self, site_url: str, client: Optional[httpx.AsyncClient] = None):
         """Initialize API discoverer"""
         self.site_url = site_url.rstrip("/")
+        self.client = client
         self.base_domain = urlparse(self.site_url).netloc
         self.user_agent = "ArbFinder-Bot/1.0"
         self.discovered_endpoints: Set[str] = set()
 
-    async def discover(self) -> Dict[str, Any]:
+    async def discover(self, client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
         """
         Discover API endpoints using multiple techniques
 
+        Args:
+            client: Client to use for this call instead of the one given at construction
+
         Returns:
             Dict containing discovered endpoints and metadata
         """
@@ -43,15 +55,17 @@ class APIDiscoverer:
             "base_path": None,
         }
 
+        client = client or self.client
+
         # Run discovery methods in parallel
         (
             doc_endpoints,
             network_endpoints,
             sitemap_endpoints,
         ) = await asyncio.gather(
-            self._discover_from_documentation(),
-            self._discover_from_network_analysis(),
-            self._discover_from_sitemap(),
+            self._discover_from_documentation(client),
+            self._discover_from_network_analysis(client),
+            self._discover_from_sitemap(client),
             return_exceptions=True,
         )
 
@@ -82,7 +96,9 @@ class APIDiscoverer:
 
         return results
 
-    async def _discover_from_documentation(self) -> Dict[str, Any]:
+    async def _discover_from_documentation(
+        self, client: Optional[httpx.AsyncClient]
+    ) -> Dict[str, Any]:
         """Try to find and parse API documentation"""
 
         results = {
@@ -106,7 +122,7 @@ class APIDiscoverer:
 
         for pattern in doc_patterns:
             url = urljoin(self.site_url, pattern)
-            content = await self._fetch_page(url)
+            content = await self._fetch_page(url, client)
 
             if content:
                 results["documentation_url"] = url
@@ -126,7 +142,9 @@ class APIDiscoverer:
 
         return results
 
-    async def _discover_from_network_analysis(self) -> List[Dict[str, Any]]:
+    async def _discover_from_network_analysis(
+        self, client: Optional[httpx.AsyncClient]
+    ) -> List[Dict[str, Any]]:
         """
         Analyze network requests by visiting main pages
         Note: This is basic - a browser automation approach would be more thorough
@@ -134,7 +152,7 @@ class APIDiscoverer:
         endpoints = []
 
         # Visit homepage and look for AJAX/API calls in JavaScript
-        homepage = await self._fetch_page(self.site_url)
+        homepage = await self._fetch_page(self.site_url, client)
         if homepage:
             # Look for API endpoints in JavaScript code
             js_endpoints = self._extract_endpoints_from_js(homepage)
@@ -142,12 +160,14 @@ class APIDiscoverer:
 
         return endpoints
 
-    async def _discover_from_sitemap(self) -> List[Dict[str, Any]]:
+    async def _discover_from_sitemap(
+        self, client: Optional[httpx.AsyncClient]
+    ) -> List[Dict[str, Any]]:
         """Check sitemap for API-like paths"""
         endpoints = []
 
         sitemap_url = urljoin(self.site_url, "/sitemap.xml")
-        content = await self._fetch_page(sitemap_url)
+        content = await self._fetch_page(sitemap_url, client)
 
         if content:
             # Parse sitemap XML
@@ -159,11 +179,10 @@ class APIDiscoverer:
 
                 for url_elem in urls:
                     url = url_elem.get_text()
+                    url_lower = url.lower()
 
                     # Look for API-like patterns
-                    if any(
-                        pattern in url.lower() for pattern in ["/api/", "/v1/", "/v2/", "/rest/"]
-                    ):
+                    if any(pattern in url_lower for pattern in _API_PATH_INDICATORS):
                         endpoints.append(
                             {
                                 "path": urlparse(url).path,
@@ -177,14 +196,15 @@ class APIDiscoverer:
 
         return endpoints
 
-    async def _fetch_page(self, url: str) -> Optional[str]:
+    async def _fetch_page(self, url: str, client: Optional[httpx.AsyncClient]) -> Optional[str]:
         """Fetch page content"""
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
+            async with open_client(client, 15.0) as client:
                 response = await client.get(
                     url,
                     headers={"User-Agent": self.user_agent},
                     follow_redirects=True,
+                    timeout=15.0,
                 )
 
                 if response.status_code == 200:
@@ -195,19 +215,28 @@ class APIDiscoverer:
 
         return None
 
-    def _parse_openapi_spec(self, content: str) -> List[Dict[str, Any]]:
-        """Parse OpenAPI/Swagger specification"""
+    def _parse_openapi_spec(self, content: Union[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Parse OpenAPI/Swagger specification from JSON text or an already-decoded dict"""
+        if isinstance(content, str):
+            try:
+                content = json.loads(content)
+            except ValueError:
+                logger.debug("Content is not valid JSON")
+                return []
+
+        return self._parse_openapi_dict(content)
+
+    def _parse_openapi_dict(self, spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Extract endpoints from a decoded OpenAPI/Swagger specification"""
         endpoints = []
 
         try:
-            spec = json.loads(content)
-
             # OpenAPI 3.x or Swagger 2.x
             paths = spec.get("paths", {})
 
             for path, methods in paths.items():
                 for method, details in methods.items():
-                    if method.upper() in ["GET", "POST", "PUT", "DELETE", "PATCH"]:
+                    if method.upper() in _HTTP_METHODS:
                         endpoint = {
                             "path": path,
                             "method": method.upper(),
@@ -231,8 +260,6 @@ class APIDiscoverer:
 
                         endpoints.append(endpoint)
 
-        except json.JSONDecodeError:
-            logger.debug("Content is not valid JSON")
         except Exception as e:
             logger.error(f"Error parsing OpenAPI spec: {e}")
 
@@ -292,10 +319,8 @@ class APIDiscoverer:
                     path = match if isinstance(match, str) else match[0]
 
                     # Filter out non-API paths
-                    if any(
-                        api_indicator in path.lower()
-                        for api_indicator in ["/api/", "/v1/", "/v2/", "/rest/"]
-                    ):
+                    path_lower = path.lower()
+                    if any(api_indicator in path_lower for api_indicator in _API_PATH_INDICATORS):
                         # Clean up the path
                         path = re.sub(r"\${[^}]+}", "{param}", path)  # Template vars
 
@@ -313,19 +338,15 @@ class APIDiscoverer:
         return endpoints
 
     def _deduplicate_endpoints(self, endpoints: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate endpoints"""
-        seen = set()
-        unique = []
+        """Remove duplicate endpoints, keeping the first occurrence in order"""
+        unique: Dict[Tuple[str, str], Dict[str, Any]] = {}
 
         for endpoint in endpoints:
-            # Create unique key from method + path
-            key = f"{endpoint.get('method', 'GET')}:{endpoint.get('path', '')}"
+            # Unique key from method + path; dicts preserve insertion order
+            key = (endpoint.get("method", "GET"), endpoint.get("path", ""))
+            unique.setdefault(key, endpoint)
 
-            if key not in seen:
-                seen.add(key)
-                unique.append(endpoint)
-
-        return unique
+        return list(unique.values())
 
     def _detect_base_path(self, endpoints: List[Dict[str, Any]]) -> Optional[str]:
         """Detect common base path for API endpoints"""
@@ -359,21 +380,19 @@ class APIDiscoverer:
         """Detect if endpoints likely require authentication"""
 
         # Check endpoint descriptions for auth keywords
-        auth_keywords = ["auth", "token", "key", "bearer", "api key"]
-
         for endpoint in endpoints:
             description = (
                 endpoint.get("description", "") + " " + endpoint.get("summary", "")
             ).lower()
 
-            if any(keyword in description for keyword in auth_keywords):
+            if any(keyword in description for keyword in _AUTH_KEYWORDS):
                 return True
 
             # Check for auth-related parameters
             params = endpoint.get("parameters", [])
             for param in params:
                 param_name = param.get("name", "").lower()
-                if any(keyword in param_name for keyword in auth_keywords):
+                if any(keyword in param_name for keyword in _AUTH_KEYWORDS):
                     return True
 
         return False
@@ -10,23 +10,31 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 
+from .http_client import open_client
+
 logger = logging.getLogger(__name__)
 
 
 class HistoricalDataFetcher:
     """Fetch historical data using Wayback Machine"""
 
-    def __init__(self, site_url: str):
+    def __init__(self, site_url: str, client: Optional[httpx.AsyncClient] = None):
         """Initialize historical data fetcher"""
         self.site_url = site_url.rstrip("/")
+        self.client = client
         self.wayback_api = "https://archive.org/wayback/available"
         self.wayback_cdx_api = "https://web.archive.org/cdx/search/cdx"
         self.user_agent = "ArbFinder-Bot/1.0"
 
-    async def check_availability(self) -> Dict[str, Any]:
+    async def check_availability(
+        self, client: Optional[httpx.AsyncClient] = None
+    ) -> Dict[str, Any]:
         """
         Check if historical snapshots are available for the site
 
+        Args:
+            client: Client to use for this call instead of the one given at construction
+
         Returns:
             Dict containing availability information
         """
@@ -42,7 +50,7 @@ class HistoricalDataFetcher:
 
         try:
             # Query Wayback Machine CDX API for snapshot count
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with open_client(client or self.client, 30.0) as client:
                 # Get first and last snapshot
                 params = {
                     "url": self.site_url,
@@ -55,6 +63,7 @@ class HistoricalDataFetcher:
                     self.wayback_cdx_api,
                     params=params,
                     headers={"User-Agent": self.user_agent},
+                    timeout=30.0,
                 )
 
                 if first_response.status_code == 200:
@@ -73,6 +82,7 @@ class HistoricalDataFetcher:
                     self.wayback_cdx_api,
                     params=params,
                     headers={"User-Agent": self.user_agent},
+                    timeout=30.0,
                 )
 
                 if last_response.status_code == 200:
@@ -92,6 +102,7 @@ class HistoricalDataFetcher:
                     self.wayback_cdx_api,
                     params=count_params,
                     headers={"User-Agent": self.user_agent},
+                    timeout=30.0,
                 )
 
                 if count_response.status_code == 200:
@@ -146,11 +157,12 @@ class HistoricalDataFetcher:
             if to_date:
                 params["to"] = to_date.strftime("%Y%m%d")
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with open_client(self.client, 30.0) as client:
                 response = await client.get(
                     self.wayback_cdx_api,
                     params=params,
                     headers={"User-Agent": self.user_agent},
+                    timeout=30.0,
                 )
 
                 if response.status_code == 200:
@@ -188,11 +200,12 @@ class HistoricalDataFetcher:
         wayback_url = self._build_wayback_url(timestamp, url)
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with open_client(self.client, 30.0) as client:
                 response = await client.get(
                     wayback_url,
                     headers={"User-Agent": self.user_agent},
                     follow_redirects=True,
+                    timeout=30.0,
                 )
 
                 if response.status_code == 200:
@@ -254,8 +267,19 @@ class HistoricalDataFetcher:
     def _parse_timestamp(self, timestamp: str) -> str:
         """Convert Wayback timestamp to ISO format"""
         try:
-            # Wayback format: YYYYMMDDhhmmss
-            dt = datetime.strptime(timestamp, "%Y%m%d%H%M%S")
+            # Wayback format: YYYYMMDDhhmmss. Fixed-width digits are sliced
+            # directly; datetime() still rejects out-of-range fields.
+            if len(timestamp) == 14 and timestamp.isdigit():
+                dt = datetime(
+                    int(timestamp[0:4]),
+                    int(timestamp[4:6]),
+                    int(timestamp[6:8]),
+                    int(timestamp[8:10]),
+                    int(timestamp[10:12]),
+                    int(timestamp[12:14]),
+                )
+            else:
+                dt = datetime.strptime(timestamp, "%Y%m%d%H%M%S")
             return dt.isoformat()
         except Exception:
             return timestamp
@@ -334,11 +358,12 @@ class HistoricalDataFetcher:
             }
 
             try:
-                async with httpx.AsyncClient(timeout=15.0) as client:
+                async with open_client(self.client, 15.0) as client:
                     response = await client.get(
                         self.wayback_api,
                         params=params,
                         headers={"User-Agent": self.user_agent},
+                        timeout=15.0,
                     )
 
                     if response.status_code == 200:
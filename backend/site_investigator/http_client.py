@@ -0,0 +1,26 @@
+"""
+Shared HTTP client handling for the site analyzers
+Lets one httpx.AsyncClient (and its keep-alive connections) serve many requests
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import httpx
+
+
+@asynccontextmanager
+async def open_client(
+    client: Optional[httpx.AsyncClient], timeout: float
+) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Yield *client* if one was given, otherwise a short-lived client
+
+    A shared client is left open for its owner to close. Its default timeout is
+    only a fallback; callers pass their own per-request timeout.
+    """
+    if client is not None:
+        yield client
+    else:
+        async with httpx.AsyncClient(timeout=timeout) as owned:
+            yield owned
@@ -10,10 +10,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import httpx
 from pydantic import BaseModel
 
 from .api_discoverer import APIDiscoverer
 from .historical_data import HistoricalDataFetcher
+from .http_client import open_client
 from .robots_analyzer import RobotsAnalyzer
 from .terms_analyzer import TermsAnalyzer
 
@@ -66,18 +68,25 @@ class SiteInvestigator:
         site_url: str,
         site_name: str,
         output_dir: str = "config/sites",
+        client: Optional[httpx.AsyncClient] = None,
     ):
-        """Initialize site investigator"""
+        """
+        Initialize site investigator
+
+        Without *client*, investigate() opens one client for the whole run so
+        the analyzers share its connections.
+        """
         self.site_url = site_url.rstrip("/")
         self.site_name = site_name
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.client = client
 
         # Initialize analyzers
-        self.robots_analyzer = RobotsAnalyzer(site_url)
-        self.terms_analyzer = TermsAnalyzer(site_url, site_name)
-        self.api_discoverer = APIDiscoverer(site_url)
-        self.historical_fetcher = HistoricalDataFetcher(site_url)
+        self.robots_analyzer = RobotsAnalyzer(site_url, client)
+        self.terms_analyzer = TermsAnalyzer(site_url, site_name, client)
+        self.api_discoverer = APIDiscoverer(site_url, client)
+        self.historical_fetcher = HistoricalDataFetcher(site_url, client)
 
     async def investigate(self) -> SiteInvestigationReport:
         """
@@ -88,14 +97,15 @@ class SiteInvestigator:
         """
         logger.info(f"Starting investigation of {self.site_name} ({self.site_url})")
 
-        # Run all analyses in parallel
-        robots_result, terms_result, api_result, historical_result = await asyncio.gather(
-            self.robots_analyzer.analyze(),
-            self.terms_analyzer.analyze(),
-            self.api_discoverer.discover(),
-            self.historical_fetcher.check_availability(),
-            return_exceptions=True,
-        )
+        # Run all analyses in parallel over one shared client
+        async with open_client(self.client, 30.0) as client:
+            robots_result, terms_result, api_result, historical_result = await asyncio.gather(
+                self.robots_analyzer.analyze(client=client),
+                self.terms_analyzer.analyze(client=client),
+                self.api_discoverer.discover(client=client),
+                self.historical_fetcher.check_availability(client=client),
+                return_exceptions=True,
+            )
 
         # Handle any exceptions
         if isinstance(robots_result, Exception):
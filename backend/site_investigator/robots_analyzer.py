@@ -4,29 +4,35 @@ Checks crawling permissions and AI-specific rules
 """
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 from urllib.parse import urljoin, urlparse
 
 import httpx
 
+from .http_client import open_client
+
 logger = logging.getLogger(__name__)
 
 
 class RobotsAnalyzer:
     """Analyze robots.txt and llms.txt for a website"""
 
-    def __init__(self, site_url: str):
+    def __init__(self, site_url: str, client: Optional[httpx.AsyncClient] = None):
         """Initialize robots analyzer"""
         self.site_url = site_url.rstrip("/")
+        self.client = client
         self.base_domain = urlparse(self.site_url).netloc
         self.robots_url = urljoin(self.site_url, "/robots.txt")
         self.llms_url = urljoin(self.site_url, "/llms.txt")
         self.user_agent = "ArbFinder-Bot/1.0"
 
-    async def analyze(self) -> Dict[str, Any]:
+    async def analyze(self, client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
         """
         Analyze robots.txt and llms.txt files
 
+        Args:
+            client: Client to use for this call instead of the one given at construction
+
         Returns:
             Dict containing analysis results
         """
@@ -43,31 +49,34 @@ class RobotsAnalyzer:
             "llms_rules": {},
         }
 
+        client = client or self.client
+
         # Fetch robots.txt
-        robots_content = await self._fetch_file(self.robots_url)
+        robots_content = await self._fetch_file(self.robots_url, client)
         if robots_content:
             results.update(self._parse_robots_txt(robots_content))
 
         # Fetch llms.txt
-        llms_content = await self._fetch_file(self.llms_url)
+        llms_content = await self._fetch_file(self.llms_url, client)
         if llms_content:
             results["llms_txt_found"] = True
             results["llms_rules"] = self._parse_llms_txt(llms_content)
 
         return results
 
-    async def _fetch_file(self, url: str) -> Optional[str]:
-        """Fetch a text file from URL"""
+    async def _fetch_file(self, url: str, client: Optional[httpx.AsyncClient]) -> Optional[bytes]:
+        """Fetch a text file from URL as raw bytes"""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with open_client(client, 10.0) as client:
                 response = await client.get(
                     url,
                     headers={"User-Agent": self.user_agent},
                     follow_redirects=True,
+                    timeout=10.0,
                 )
 
                 if response.status_code == 200:
-                    return response.text
+                    return response.content
                 elif response.status_code == 404:
                     logger.info(f"File not found: {url}")
                 else:
@@ -78,8 +87,16 @@ class RobotsAnalyzer:
 
         return None
 
-    def _parse_robots_txt(self, content: str) -> Dict[str, Any]:
-        """Parse robots.txt content"""
+    def _parse_robots_txt(self, content: Union[bytes, str]) -> Dict[str, Any]:
+        """
+        Parse robots.txt content
+
+        Directives are ASCII, so the content is scanned as bytes and only the
+        values that are kept get decoded.
+        """
+        if isinstance(content, str):
+            content = content.encode()
+
         results = {
             "allowed": True,
             "crawl_delay": None,
@@ -92,20 +109,20 @@ class RobotsAnalyzer:
         current_user_agent = None
         user_agent_rules = {}
 
-        for line in content.split("\n"):
+        for line in content.split(b"\n"):
             line = line.strip()
 
             # Skip comments and empty lines
-            if not line or line.startswith("#"):
+            if not line or line.startswith(b"#"):
                 continue
 
             # Parse directives
-            if ":" in line:
-                directive, value = line.split(":", 1)
+            if b":" in line:
+                directive, value = line.split(b":", 1)
                 directive = directive.strip().lower()
-                value = value.strip()
+                value = value.strip().decode("utf-8", errors="replace")
 
-                if directive == "user-agent":
+                if directive == b"user-agent":
                     current_user_agent = value
                     if current_user_agent not in user_agent_rules:
                         user_agent_rules[current_user_agent] = {
@@ -114,21 +131,21 @@ class RobotsAnalyzer:
                             "crawl_delay": None,
                         }
 
-                elif directive == "disallow" and current_user_agent:
+                elif directive == b"disallow" and current_user_agent:
                     if value:
                         user_agent_rules[current_user_agent]["disallow"].append(value)
 
-                elif directive == "allow" and current_user_agent:
+                elif directive == b"allow" and current_user_agent:
                     if value:
                         user_agent_rules[current_user_agent]["allow"].append(value)
 
-                elif directive == "crawl-delay" and current_user_agent:
+                elif directive == b"crawl-delay" and current_user_agent:
                     try:
                         user_agent_rules[current_user_agent]["crawl_delay"] = float(value)
                     except ValueError:
                         logger.warning(f"Invalid crawl-delay value: {value}")
 
-                elif directive == "sitemap":
+                elif directive == b"sitemap":
                     results["sitemaps"].append(value)
 
         # Apply rules for our bot or * (all bots)
@@ -157,7 +174,7 @@ class RobotsAnalyzer:
 
         return results
 
-    def _parse_llms_txt(self, content: str) -> Dict[str, Any]:
+    def _parse_llms_txt(self, content: Union[bytes, str]) -> Dict[str, Any]:
         """
         Parse llms.txt content
 
@@ -172,6 +189,9 @@ class RobotsAnalyzer:
             "restrictions": [],
         }
 
+        if isinstance(content, bytes):
+            content = content.decode("utf-8", errors="replace")
+
         for line in content.split("\n"):
             line = line.strip()
 
@@ -11,15 +11,58 @@ from urllib.parse import urljoin
 import httpx
 from bs4 import BeautifulSoup
 
+from .http_client import open_client
+
 logger = logging.getLogger(__name__)
 
 
+def _any_of(*patterns: str) -> "re.Pattern[str]":
+    """Compile alternative patterns into one regex so the text is scanned once."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+
+# Policy patterns, matched against lowercased terms content
+_API_RE = _any_of(
+    r"api[\s]+(?:access|usage|key|endpoint)",
+    r"application[\s]+programming[\s]+interface",
+    r"developer[\s]+(?:access|portal|api)",
+)
+_SCRAPING_PROHIBITED_RE = _any_of(
+    r"(?:prohibit|forbid|not[\s]+(?:allow|permit)).*?(?:scrap|crawl|automat|robot|bot)",
+    r"(?:scrap|crawl|automat|robot|bot).*?(?:prohibit|forbid|not[\s]+(?:allow|permit))",
+    r"unauthorized[\s]+(?:access|data[\s]+collection|extraction)",
+)
+_PERMISSIVE_RE = _any_of(
+    r"(?:allow|permit|may).*?(?:access|use).*?(?:data|content)",
+    r"publicly[\s]+available",
+)
+_COMMERCIAL_RESTRICTED_RE = _any_of(
+    r"(?:prohibit|forbid|not[\s]+(?:allow|permit)).*?commercial[\s]+use",
+    r"non[\s]*-?[\s]*commercial[\s]+use[\s]+only",
+    r"personal[\s]+use[\s]+only",
+)
+# Rate limit patterns capture different groups, so they stay separate
+_RATE_LIMIT_RES = (
+    re.compile(r"(?:rate[\s]+limit|request[\s]+limit).*?(\d+).*?(per|every|each)[\s]+(\w+)"),
+    re.compile(r"(\d+)[\s]+requests?[\s]+per[\s]+(\w+)"),
+)
+_DATA_RETENTION_RE = _any_of(
+    r"(?:data|information).*?(?:retain|store|keep)",
+    r"(?:delete|remove).*?(?:data|information)",
+    r"data[\s]+retention",
+)
+_ATTRIBUTION_RE = re.compile(r"attribut|credit|cite|source")
+
+
 class TermsAnalyzer:
     """Analyze Terms of Service and usage policies"""
 
-    def __init__(self, site_url: str, site_name: str):
+    def __init__(
+        self, site_url: str, site_name: str, client: Optional[httpx.AsyncClient] = None
+    ):
         """Initialize terms analyzer"""
         self.site_url = site_url.rstrip("/")
+        self.client = client
         self.site_name = site_name
         self.user_agent = "ArbFinder-Bot/1.0"
 
@@ -35,10 +78,13 @@ class TermsAnalyzer:
             "/user-agreement",
         ]
 
-    async def analyze(self) -> Dict[str, Any]:
+    async def analyze(self, client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
         """
         Analyze Terms of Service and usage policies
 
+        Args:
+            client: Client to use for this call instead of the one given at construction
+
         Returns:
             Dict containing analysis results
         """
@@ -54,8 +100,10 @@ class TermsAnalyzer:
             "key_findings": [],
         }
 
+        client = client or self.client
+
         # Find ToS page
-        terms_url = await self._find_terms_page()
+        terms_url = await self._find_terms_page(client)
         if not terms_url:
             logger.warning("Could not locate Terms of Service page")
             results["key_findings"].append("Terms of Service page not found")
@@ -64,7 +112,7 @@ class TermsAnalyzer:
         results["terms_url"] = terms_url
 
         # Fetch and parse ToS content
-        terms_content = await self._fetch_page(terms_url)
+        terms_content = await self._fetch_page(terms_url, client)
         if not terms_content:
             logger.warning(f"Could not fetch Terms page: {terms_url}")
             return results
@@ -75,18 +123,18 @@ class TermsAnalyzer:
 
         return results
 
-    async def _find_terms_page(self) -> Optional[str]:
+    async def _find_terms_page(self, client: Optional[httpx.AsyncClient]) -> Optional[str]:
         """Try to find the Terms of Service page"""
 
         # First, try common URL patterns
         for pattern in self.tos_patterns:
             url = urljoin(self.site_url, pattern)
-            if await self._check_url_exists(url):
+            if await self._check_url_exists(url, client):
                 logger.info(f"Found ToS page: {url}")
                 return url
 
         # Try to find link on homepage
-        homepage_content = await self._fetch_page(self.site_url)
+        homepage_content = await self._fetch_page(self.site_url, client)
         if homepage_content:
             terms_link = self._find_terms_link_in_html(homepage_content)
             if terms_link:
@@ -96,27 +144,29 @@ class TermsAnalyzer:
 
         return None
 
-    async def _check_url_exists(self, url: str) -> bool:
+    async def _check_url_exists(self, url: str, client: Optional[httpx.AsyncClient]) -> bool:
         """Check if a URL exists (returns 200)"""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with open_client(client, 10.0) as client:
                 response = await client.head(
                     url,
                     headers={"User-Agent": self.user_agent},
                     follow_redirects=True,
+                    timeout=10.0,
                 )
                 return response.status_code == 200
         except httpx.HTTPError:
             return False
 
-    async def _fetch_page(self, url: str) -> Optional[str]:
+    async def _fetch_page(self, url: str, client: Optional[httpx.AsyncClient]) -> Optional[str]:
         """Fetch page content"""
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
+            async with open_client(client, 15.0) as client:
                 response = await client.get(
                     url,
                     headers={"User-Agent": self.user_agent},
                     follow_redirects=True,
+                    timeout=15.0,
                 )
 
                 if response.status_code == 200:
@@ -172,87 +222,39 @@ class TermsAnalyzer:
         content_lower = content.lower()
 
         # Check for API mentions
-        api_patterns = [
-            r"api[\s]+(?:access|usage|key|endpoint)",
-            r"application[\s]+programming[\s]+interface",
-            r"developer[\s]+(?:access|portal|api)",
-        ]
-
-        for pattern in api_patterns:
-            if re.search(pattern, content_lower):
-                results["api_allowed"] = True
-                results["key_findings"].append("API usage mentioned in terms")
-                break
+        if _API_RE.search(content_lower):
+            results["api_allowed"] = True
+            results["key_findings"].append("API usage mentioned in terms")
 
         # Check for scraping restrictions
-        scraping_patterns = [
-            r"(?:prohibit|forbid|not[\s]+(?:allow|permit)).*?(?:scrap|crawl|automat|robot|bot)",
-            r"(?:scrap|crawl|automat|robot|bot).*?(?:prohibit|forbid|not[\s]+(?:allow|permit))",
-            r"unauthorized[\s]+(?:access|data[\s]+collection|extraction)",
-        ]
-
-        scraping_prohibited = False
-        for pattern in scraping_patterns:
-            if re.search(pattern, content_lower):
-                scraping_prohibited = True
-                results["restrictions"].append("Automated scraping/crawling prohibited in terms")
-                break
+        scraping_prohibited = bool(_SCRAPING_PROHIBITED_RE.search(content_lower))
+        if scraping_prohibited:
+            results["restrictions"].append("Automated scraping/crawling prohibited in terms")
 
         # If not explicitly prohibited, check for permissive language
-        if not scraping_prohibited:
-            permissive_patterns = [
-                r"(?:allow|permit|may).*?(?:access|use).*?(?:data|content)",
-                r"publicly[\s]+available",
-            ]
-
-            for pattern in permissive_patterns:
-                if re.search(pattern, content_lower):
-                    results["scraping_allowed"] = True
-                    break
+        if not scraping_prohibited and _PERMISSIVE_RE.search(content_lower):
+            results["scraping_allowed"] = True
 
         # Check for commercial use restrictions
-        commercial_patterns = [
-            r"(?:prohibit|forbid|not[\s]+(?:allow|permit)).*?commercial[\s]+use",
-            r"non[\s]*-?[\s]*commercial[\s]+use[\s]+only",
-            r"personal[\s]+use[\s]+only",
-        ]
-
-        for pattern in commercial_patterns:
-            if re.search(pattern, content_lower):
-                results["commercial_use_allowed"] = False
-                results["restrictions"].append("Commercial use restricted")
-                break
+        if _COMMERCIAL_RESTRICTED_RE.search(content_lower):
+            results["commercial_use_allowed"] = False
+            results["restrictions"].append("Commercial use restricted")
 
         # Look for rate limit mentions
-        rate_limit_patterns = [
-            r"(?:rate[\s]+limit|request[\s]+limit).*?(\d+).*?(per|every|each)[\s]+(\w+)",
-            r"(\d+)[\s]+requests?[\s]+per[\s]+(\w+)",
-        ]
-
-        for pattern in rate_limit_patterns:
-            matches = re.findall(pattern, content_lower)
-            if matches:
-                for match in matches:
-                    if len(match) >= 2:
-                        results["rate_limits"]["requests"] = match[0]
-                        results["key_findings"].append(
-                            f"Rate limit found: {match[0]} per {match[-1]}"
-                        )
+        for pattern in _RATE_LIMIT_RES:
+            for match in pattern.findall(content_lower):
+                if len(match) >= 2:
+                    results["rate_limits"]["requests"] = match[0]
+                    results["key_findings"].append(
+                        f"Rate limit found: {match[0]} per {match[-1]}"
+                    )
 
         # Check for data retention/usage restrictions
-        data_patterns = [
-            r"(?:data|information).*?(?:retain|store|keep)",
-            r"(?:delete|remove).*?(?:data|information)",
-            r"data[\s]+retention",
-        ]
-
-        for pattern in data_patterns:
-            if re.search(pattern, content_lower):
-                results["key_findings"].append("Data retention policies mentioned")
-                break
+        if _DATA_RETENTION_RE.search(content_lower):
+            results["key_findings"].append("Data retention policies mentioned")
 
         # Check for attribution requirements
-        if re.search(r"attribut|credit|cite|source", content_lower):
+        if _ATTRIBUTION_RE.search(content_lower):
             results["restrictions"].append("Attribution may be required")
 
         return results
@@ -21,17 +21,21 @@ def inspect_database(db_path: str) -> Dict[str, Any]:
     tables = c.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
     stats["tables"] = [t[0] for t in tables]
 
-    # Listings stats
+    # Listings stats; the total and price range come from one scan
+    price_range = c.execute("""
+        SELECT MIN(CASE WHEN price > 0 THEN price END),
+               MAX(CASE WHEN price > 0 THEN price END),
+               AVG(CASE WHEN price > 0 THEN price END),
+               COUNT(*)
+        FROM listings
+        """).fetchone()
     stats["listings"] = {}
-    stats["listings"]["total"] = c.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+    stats["listings"]["total"] = price_range[3]
     stats["listings"]["by_source"] = {}
     for row in c.execute("SELECT source, COUNT(*) FROM listings GROUP BY source"):
         stats["listings"]["by_source"][row[0]] = row[1]
 
-    # Get price range
-    price_range = c.execute(
-        "SELECT MIN(price), MAX(price), AVG(price) FROM listings WHERE price > 0"
-    ).fetchone()
+    # Positive prices only, from the aggregate SELECT above
     stats["listings"]["price_range"] = {
         "min": price_range[0],
         "max": price_range[1],
@@ -145,6 +145,26 @@ class CloudflareAPIClient:
         """Make GET request."""
         return self._make_request("GET", endpoint, params=params)
     
+    def get_all(self, endpoint: str, per_page: int = 100) -> List[Dict]:
+        """Make GET requests for every page of a list endpoint.
+        
+        Args:
+            endpoint: API endpoint path
+            per_page: Page size to request
+            
+        Returns:
+            Items from all pages, in order
+        """
+        items = []
+        page = 1
+        while True:
+            batch = self.get(endpoint, params={"page": page, "per_page": per_page})
+            items.extend(batch)
+            # A short page is the last one
+            if len(batch) < per_page:
+                return items
+            page += 1
+    
     def post(self, endpoint: str, data: Optional[Dict] = None) -> Dict:
         """Make POST request."""
         return self._make_request("POST", endpoint, data=data)
@@ -297,7 +317,23 @@ class CloudflareSetup:
         created_namespaces = []
         endpoint = f"/accounts/{self.config.account_id}/storage/kv/namespaces"
         
+        # List existing namespaces once instead of probing per namespace
+        try:
+            existing = {
+                ns.get("title"): ns.get("id")
+                for ns in self.client.get_all(endpoint)
+            }
+        except Exception as e:
+            logger.warning(f"Could not list KV namespaces: {e}")
+            existing = {}
+        
         for namespace_name in namespace_names:
+            namespace_id = existing.get(namespace_name)
+            if namespace_id:
+                console.print(f"KV namespace '{namespace_name}' already exists (ID: {namespace_id})")
+                created_namespaces.append({"name": namespace_name, "id": namespace_id})
+                continue
+            
             try:
                 data = {"title": namespace_name}
                 result = self.client.post(endpoint, data=data)
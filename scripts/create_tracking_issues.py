@@ -3,27 +3,60 @@
 
 Usage:
     python3 scripts/create_tracking_issues.py [--dry-run] [--repo OWNER/REPO] [--token TOKEN]
+                                              [--force]
 
 Arguments:
     --dry-run       Print issue definitions without creating them (default: True unless --token given)
     --repo          GitHub repository in OWNER/REPO format (default: cbwinslow/arbfinder-suite)
-    --token         GitHub personal access token (or set GITHUB_TOKEN env var)
+    --token         GitHub personal access token (or set GH_TOKEN / GITHUB_TOKEN env var)
+    --force         Ignore the local cache of previously created issues
 
 The script is idempotent: it checks for existing issues with the same title and
-skips creation if a matching issue already exists.
+skips creation if a matching issue already exists. Issues it has created are
+also recorded in ``.cache/issues_created.json`` so a re-run after a partial
+failure skips them without asking GitHub.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import http.client
+import io
 import json
 import os
 import sys
+import threading
 import time
 import urllib.error
-import urllib.request
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
+from json_cache import load_json_cache, save_json_cache
+
+API_HOST = "api.github.com"
+# Issues created by earlier runs: sha1(repo + title) -> issue URL
+CACHE_PATH = Path(__file__).resolve().parent.parent / ".cache" / "issues_created.json"
+# Number of createIssue mutations sent per GraphQL request
+BATCH_SIZE = 20
+# Attempts per request when GitHub answers with a rate-limit response
+RETRY_MAX = 3
+# Colours for labels this script creates; anything else gets GitHub's default grey
+LABEL_COLOURS = {
+    "smoke-tests": "0e8a16",
+    "e2e": "0075ca",
+    "logging": "e4e669",
+    "etl": "d93f0b",
+    "infrastructure": "c2e0c6",
+    "ci-cd": "bfd4f2",
+    "cloudflare": "f9d0c4",
+    "ai": "5319e7",
+    "performance": "fef2c0",
+    "testing": "006b75",
+    "automation": "1d76db",
+    "docker": "0052cc",
+    "enhancement": "a2eeef",
+}
 
 ISSUES: List[Dict[str, Any]] = [
     # -----------------------------------------------------------------------
@@ -227,23 +260,44 @@ ISSUES: List[Dict[str, Any]] = [
 
 
 def _get_existing_titles(repo: str, token: str) -> set:
-    """Return the titles of all open issues in *repo*."""
+    """Return the titles of all open issues in *repo*.
+
+    Only the ``title`` field is requested, so GitHub does not send (and we do
+    not decode) full issue payloads with bodies, users, and labels.
+    """
+    owner, name = repo.split("/", 1)
+    query = """
+    query($owner: String!, $name: String!, $cursor: String) {
+      repository(owner: $owner, name: $name) {
+        issues(states: OPEN, first: 100, after: $cursor) {
+          nodes { title }
+          pageInfo { hasNextPage endCursor }
+        }
+      }
+    }
+    """
     titles = set()
-    page = 1
+    cursor = None
     while True:
-        url = f"https://api.github.com/repos/{repo}/issues?state=open&per_page=100&page={page}"
-        req = urllib.request.Request(url, headers=_headers(token))
         try:
-            with urllib.request.urlopen(req) as resp:
-                issues = json.loads(resp.read())
-        except urllib.error.URLError as e:
+            result = _graphql(
+                token, query, {"owner": owner, "name": name, "cursor": cursor}, idempotent=True
+            )
+        except OSError as e:
             print(f"Warning: could not fetch existing issues: {e}", file=sys.stderr)
             return titles
-        if not issues:
+        repository = (result.get("data") or {}).get("repository")
+        if not repository:
+            print(
+                f"Warning: could not fetch existing issues: {result.get('errors')}",
+                file=sys.stderr,
+            )
+            return titles
+        issues = repository["issues"]
+        titles.update(node["title"] for node in issues["nodes"])
+        if not issues["pageInfo"]["hasNextPage"]:
             break
-        for issue in issues:
-            titles.add(issue["title"])
-        page += 1
+        cursor = issues["pageInfo"]["endCursor"]
     return titles
 
 
@@ -253,46 +307,208 @@ def _headers(token: str) -> Dict[str, str]:
         "Accept": "application/vnd.github+json",
         "X-GitHub-Api-Version": "2022-11-28",
         "Content-Type": "application/json",
+        "User-Agent": "arbfinder-suite-tracking-issues",
+    }
+
+
+def _cache_key(repo: str, title: str) -> str:
+    return hashlib.sha1(f"{repo}\n{title}".encode()).hexdigest()
+
+
+# One keep-alive HTTPS connection per thread, reused across requests
+_local = threading.local()
+
+
+def _api_request(
+    token: str, method: str, path: str, payload: bytes, idempotent: bool = False
+) -> Any:
+    """Send a request over this thread's persistent connection and decode the JSON reply.
+
+    A request that fails while being sent on a reused (possibly stale) connection
+    is retried once on a fresh one. A failure while waiting for the response is
+    only retried when *idempotent* is set: the server may already have acted on
+    the request, and resending a mutation could create duplicates. A timeout
+    while sending follows the same rule, since part of the request may have gone
+    out before the socket stalled.
+
+    Errors are raised as :class:`urllib.error.HTTPError` so callers can inspect
+    ``code``/``headers`` exactly as with ``urllib.request.urlopen``.
+    """
+    for attempt in range(2):
+        conn = getattr(_local, "conn", None)
+        reused = conn is not None
+        if conn is None:
+            conn = _local.conn = http.client.HTTPSConnection(API_HOST, timeout=30)
+        try:
+            conn.request(method, path, body=payload, headers=_headers(token))
+        except (http.client.HTTPException, ConnectionError, TimeoutError) as e:
+            # The server may drop an idle keep-alive connection; reconnect once
+            conn.close()
+            _local.conn = None
+            if attempt or not reused or (isinstance(e, TimeoutError) and not idempotent):
+                raise
+            continue
+        try:
+            resp = conn.getresponse()
+            body = resp.read()
+            break
+        except (http.client.HTTPException, ConnectionError, TimeoutError):
+            # The request went out, so only a read-only call may be resent
+            conn.close()
+            _local.conn = None
+            if attempt or not (reused and idempotent):
+                raise
+    if resp.status >= 400:
+        raise urllib.error.HTTPError(
+            f"https://{API_HOST}{path}", resp.status, resp.reason, resp.headers, io.BytesIO(body)
+        )
+    return json.loads(body)
+
+
+def _graphql(
+    token: str,
+    query: str,
+    variables: Optional[Dict[str, Any]] = None,
+    idempotent: bool = False,
+) -> Dict[str, Any]:
+    """Run a GraphQL *query* and return the decoded response (``data`` and ``errors``).
+
+    Pass ``idempotent=True`` for read-only queries, which may be resent after a
+    dropped connection; mutations never are.
+    """
+    payload = json.dumps({"query": query, "variables": variables or {}}).encode()
+    for attempt in range(1, RETRY_MAX + 1):
+        try:
+            return _api_request(token, "POST", "/graphql", payload, idempotent)
+        except urllib.error.HTTPError as e:
+            # 403/429 with Retry-After = secondary rate limit; wait and try again
+            retry_after = e.headers.get("Retry-After")
+            if e.code not in (403, 429) or retry_after is None or attempt == RETRY_MAX:
+                raise
+            time.sleep(float(retry_after))
+    raise AssertionError("unreachable")
+
+
+def _resolve_repo(repo: str, token: str) -> Tuple[str, Dict[str, str]]:
+    """Return the node ID of *repo* and a label name → label node ID mapping."""
+    owner, name = repo.split("/", 1)
+    query = """
+    query($owner: String!, $name: String!) {
+      repository(owner: $owner, name: $name) {
+        id
+        labels(first: 100) { nodes { id name } }
+      }
     }
+    """
+    result = _graphql(token, query, {"owner": owner, "name": name}, idempotent=True)
+    repository = (result.get("data") or {}).get("repository")
+    if not repository:
+        raise RuntimeError(f"could not resolve repository {repo}: {result.get('errors')}")
+    labels = {node["name"]: node["id"] for node in repository["labels"]["nodes"]}
+    return repository["id"], labels
+
+
+def _create_issue_batch(
+    token: str,
+    repo_id: str,
+    label_ids: Dict[str, str],
+    batch: List[Dict[str, Any]],
+) -> Dict[str, str]:
+    """Create *batch* issues with one aliased ``createIssue`` mutation.
 
+    Returns a title → issue URL mapping for the issues that were created.
+    """
+    params = ", ".join(f"$i{n}: CreateIssueInput!" for n in range(len(batch)))
+    fields = "\n".join(
+        f"  i{n}: createIssue(input: $i{n}) {{ issue {{ number url }} }}"
+        for n in range(len(batch))
+    )
+    variables = {
+        f"i{n}": {
+            "repositoryId": repo_id,
+            "title": issue["title"],
+            "body": issue["body"],
+            "labelIds": [
+                label_ids[label] for label in issue.get("labels", []) if label in label_ids
+            ],
+        }
+        for n, issue in enumerate(batch)
+    }
+    try:
+        result = _graphql(token, f"mutation({params}) {{\n{fields}\n}}", variables)
+    except urllib.error.HTTPError as e:
+        body = e.read().decode(errors="replace")
+        for issue in batch:
+            print(f"  ❌ FAILED: {issue['title']}\n     {e.code}: {body}", file=sys.stderr)
+        return {}
 
-def _ensure_label(repo: str, token: str, label: str) -> None:
-    """Create *label* in *repo* if it doesn't already exist."""
-    url = f"https://api.github.com/repos/{repo}/labels"
-    # List existing labels (simplified – just try to create; ignore 422 duplicate)
-    colour_map = {
-        "smoke-tests": "0e8a16",
-        "e2e": "0075ca",
-        "logging": "e4e669",
-        "etl": "d93f0b",
-        "infrastructure": "c2e0c6",
-        "ci-cd": "bfd4f2",
-        "cloudflare": "f9d0c4",
-        "ai": "5319e7",
-        "performance": "fef2c0",
-        "testing": "006b75",
-        "automation": "1d76db",
-        "docker": "0052cc",
-        "enhancement": "a2eeef",
+    data = result.get("data") or {}
+    # Errors not tied to one alias carry "path": null
+    errors = {
+        (err.get("path") or [None])[0]: err.get("message") for err in result.get("errors") or []
     }
+    created = {}
+    for n, issue in enumerate(batch):
+        created_issue = (data.get(f"i{n}") or {}).get("issue")
+        if created_issue:
+            print(f"  ✅ Created #{created_issue['number']}: {issue['title']}")
+            created[issue["title"]] = created_issue["url"]
+        else:
+            message = errors.get(f"i{n}", "unknown error")
+            print(f"  ❌ FAILED: {issue['title']}\n     {message}", file=sys.stderr)
+    return created
+
+
+def _create_issue_batches(
+    repo: str,
+    token: str,
+    repo_id: str,
+    label_ids: Dict[str, str],
+    issues: List[Dict[str, Any]],
+    cache: Dict[str, str],
+) -> int:
+    """Create *issues* in batches of BATCH_SIZE, one request after another.
+
+    GitHub asks for content-creating requests to be sent serially; concurrent
+    mutations trigger its secondary rate limits.
+
+    *cache* is updated and saved as each batch finishes, so issues created before
+    a failure are not re-created on the next run.
+    """
+    created = 0
+    for start in range(0, len(issues), BATCH_SIZE):
+        urls = _create_issue_batch(token, repo_id, label_ids, issues[start : start + BATCH_SIZE])
+        if urls:
+            cache.update((_cache_key(repo, title), url) for title, url in urls.items())
+            save_json_cache(CACHE_PATH, cache)
+            created += len(urls)
+    return created
+
+
+def _create_label(repo: str, token: str, label: str) -> Optional[str]:
+    """Create *label* in *repo* and return its node ID (None on failure)."""
     payload = json.dumps({
         "name": label,
-        "color": colour_map.get(label, "ededed"),
+        "color": LABEL_COLOURS.get(label, "ededed"),
     }).encode()
-    req = urllib.request.Request(url, data=payload, headers=_headers(token), method="POST")
     try:
-        urllib.request.urlopen(req)
+        return _api_request(token, "POST", f"/repos/{repo}/labels", payload)["node_id"]
     except urllib.error.HTTPError as e:
-        if e.code != 422:  # 422 = already exists
+        if e.code != 422:  # 422 = already exists (beyond the first 100 resolved labels)
             print(f"  ⚠ Could not create label '{label}': {e}", file=sys.stderr)
+        return None
 
 
 def create_issues(
     repo: str,
     token: str,
     dry_run: bool = True,
+    force: bool = False,
 ) -> None:
-    """Create all tracking issues in *repo*."""
+    """Create all tracking issues in *repo*.
+
+    Issues recorded in the local cache are skipped unless *force* is set.
+    """
     if dry_run:
         print(f"[DRY RUN] Would create {len(ISSUES)} issues in {repo}:\n")
         for i, issue in enumerate(ISSUES, 1):
@@ -300,13 +516,14 @@ def create_issues(
             print(f"     Labels: {', '.join(issue.get('labels', []))}")
         return
 
+    cache = load_json_cache(CACHE_PATH)
     print(f"Fetching existing issues from {repo}…")
     existing = _get_existing_titles(repo, token)
     print(f"Found {len(existing)} existing open issues.\n")
 
-    url = f"https://api.github.com/repos/{repo}/issues"
     created = 0
     skipped = 0
+    pending = []
 
     for issue in ISSUES:
         title = issue["title"]
@@ -314,26 +531,25 @@ def create_issues(
             print(f"  ⏭  SKIP (exists): {title}")
             skipped += 1
             continue
+        if not force and _cache_key(repo, title) in cache:
+            print(f"  ⏭  SKIP (cached): {title} → {cache[_cache_key(repo, title)]}")
+            skipped += 1
+            continue
 
-        # Ensure labels exist
-        for label in issue.get("labels", []):
-            _ensure_label(repo, token, label)
+        pending.append(issue)
 
-        payload = json.dumps({
-            "title": title,
-            "body": issue["body"],
-            "labels": issue.get("labels", []),
-        }).encode()
-        req = urllib.request.Request(url, data=payload, headers=_headers(token), method="POST")
-        try:
-            with urllib.request.urlopen(req) as resp:
-                created_issue = json.loads(resp.read())
-            print(f"  ✅ Created #{created_issue['number']}: {title}")
-            created += 1
-            time.sleep(0.5)  # be polite to the API
-        except urllib.error.HTTPError as e:
-            body = e.read().decode(errors="replace")
-            print(f"  ❌ FAILED: {title}\n     {e.code}: {body}", file=sys.stderr)
+    if pending:
+        repo_id, label_ids = _resolve_repo(repo, token)
+
+        # Create each missing label once, up front, rather than per issue
+        wanted = dict.fromkeys(label for issue in pending for label in issue.get("labels", []))
+        for label in wanted:
+            if label not in label_ids:
+                label_id = _create_label(repo, token, label)
+                if label_id:
+                    label_ids[label] = label_id
+
+        created = _create_issue_batches(repo, token, repo_id, label_ids, pending, cache)
 
     print(f"\nDone: {created} created, {skipped} skipped.")
 
@@ -341,13 +557,22 @@ def create_issues(
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--repo", default="cbwinslow/arbfinder-suite", help="OWNER/REPO")
-    parser.add_argument("--token", default=os.environ.get("GITHUB_TOKEN", ""), help="GitHub token")
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN", ""),
+        help="GitHub token (defaults to GH_TOKEN, then GITHUB_TOKEN)",
+    )
     parser.add_argument(
         "--dry-run",
         action=argparse.BooleanOptionalAction,
         default=None,
         help="Print issues without creating (default: True if no token)",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore the local cache of previously created issues",
+    )
     args = parser.parse_args()
 
     dry_run = args.dry_run
@@ -355,10 +580,18 @@ def main() -> None:
         dry_run = not bool(args.token)
 
     if not dry_run and not args.token:
-        print("Error: --token or GITHUB_TOKEN required when not using --dry-run.", file=sys.stderr)
+        print(
+            "Error: --token, GH_TOKEN or GITHUB_TOKEN required when not using --dry-run.",
+            file=sys.stderr,
+        )
         sys.exit(1)
 
-    create_issues(repo=args.repo, token=args.token, dry_run=dry_run)
+    try:
+        create_issues(repo=args.repo, token=args.token, dry_run=dry_run, force=args.force)
+    except (OSError, http.client.HTTPException, RuntimeError) as e:
+        # Network failures and an unresolvable repository end the run cleanly
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -4,14 +4,59 @@ CrewAI Development Crew - Automated Software Development
 This script runs a crew of AI agents that specialize in software development.
 """
 
-import argparse
+import asyncio
 import json
-import os
 import sys
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _write_output(output: str, output_data: dict):
+    """Write *output_data* as indented JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        Path(output).write_bytes(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output, 'w') as f:
+            json.dump(output_data, f, indent=2)
+
+
+# Agent backstories and fixed task descriptions, defined once at module level
+_RESEARCHER_BACKSTORY = (
+    "You are an expert code researcher with deep knowledge of software architecture, "
+    "design patterns, and best practices. You excel at identifying code smells, "
+    "performance bottlenecks, and areas for enhancement."
+)
+_DEVELOPER_BACKSTORY = (
+    "You are a senior software developer with 10+ years of experience in Python, "
+    "JavaScript, and full-stack development. You write clean, efficient, and "
+    "well-documented code."
+)
+_TESTER_BACKSTORY = (
+    "You are a meticulous QA engineer who believes in test-driven development. You "
+    "write comprehensive unit tests, integration tests, and ensure high code "
+    "coverage."
+)
+_REVIEWER_BACKSTORY = (
+    "You are a thorough code reviewer who ensures all code meets quality standards, "
+    "follows best practices, and is well-documented. You provide constructive "
+    "feedback and suggest improvements."
+)
+_TESTING_DESCRIPTION = """Write comprehensive tests for all changes:
+    1. Unit tests for new functionality
+    2. Integration tests where applicable
+    3. Update existing tests if needed
+    4. Ensure coverage is above 80%"""
+_REVIEW_DESCRIPTION = """Review all changes and provide feedback:
+    1. Code quality assessment
+    2. Test coverage review
+    3. Documentation review
+    4. Final recommendations"""
 
 
 def run_development_crew(task: str, priority: str, output: str):
@@ -35,9 +80,7 @@ def run_development_crew(task: str, priority: str, output: str):
         researcher = Agent(
             role='Code Researcher',
             goal='Analyze codebase and identify areas for improvement',
-            backstory="""You are an expert code researcher with deep knowledge of software 
-            architecture, design patterns, and best practices. You excel at identifying 
-            code smells, performance bottlenecks, and areas for enhancement.""",
+            backstory=_RESEARCHER_BACKSTORY,
             verbose=True,
             allow_delegation=True
         )
@@ -45,9 +88,7 @@ def run_development_crew(task: str, priority: str, output: str):
         developer = Agent(
             role='Senior Software Developer',
             goal='Implement code improvements and new features',
-            backstory="""You are a senior software developer with 10+ years of experience 
-            in Python, JavaScript, and full-stack development. You write clean, efficient, 
-            and well-documented code.""",
+            backstory=_DEVELOPER_BACKSTORY,
             verbose=True,
             allow_delegation=True
         )
@@ -55,9 +96,7 @@ def run_development_crew(task: str, priority: str, output: str):
         tester = Agent(
             role='Quality Assurance Engineer',
             goal='Write comprehensive tests and ensure code quality',
-            backstory="""You are a meticulous QA engineer who believes in test-driven 
-            development. You write comprehensive unit tests, integration tests, and 
-            ensure high code coverage.""",
+            backstory=_TESTER_BACKSTORY,
             verbose=True,
             allow_delegation=False
         )
@@ -65,9 +104,7 @@ def run_development_crew(task: str, priority: str, output: str):
         reviewer = Agent(
             role='Code Reviewer',
             goal='Review code changes and ensure quality standards',
-            backstory="""You are a thorough code reviewer who ensures all code meets 
-            quality standards, follows best practices, and is well-documented. You 
-            provide constructive feedback and suggest improvements.""",
+            backstory=_REVIEWER_BACKSTORY,
             verbose=True,
             allow_delegation=False
         )
@@ -99,21 +136,13 @@ def run_development_crew(task: str, priority: str, output: str):
         )
         
         testing_task = Task(
-            description="""Write comprehensive tests for all changes:
-            1. Unit tests for new functionality
-            2. Integration tests where applicable
-            3. Update existing tests if needed
-            4. Ensure coverage is above 80%""",
+            description=_TESTING_DESCRIPTION,
             agent=tester,
             expected_output="Complete test suite with high coverage"
         )
         
         review_task = Task(
-            description="""Review all changes and provide feedback:
-            1. Code quality assessment
-            2. Test coverage review
-            3. Documentation review
-            4. Final recommendations""",
+            description=_REVIEW_DESCRIPTION,
             agent=reviewer,
             expected_output="Detailed code review with approval or suggestions"
         )
@@ -139,8 +168,7 @@ def run_development_crew(task: str, priority: str, output: str):
             "agents": ["researcher", "developer", "tester", "reviewer"]
         }
         
-        with open(output, 'w') as f:
-            json.dump(output_data, f, indent=2)
+        _write_output(output, output_data)
         
         print(f"\n✅ Development crew completed successfully!")
         print(f"📄 Output saved to: {output}")
@@ -160,8 +188,7 @@ def run_development_crew(task: str, priority: str, output: str):
             "message": "Install crewai package to use this feature"
         }
         
-        with open(output, 'w') as f:
-            json.dump(output_data, f, indent=2)
+        _write_output(output, output_data)
         
         return 1
         
@@ -176,21 +203,53 @@ def run_development_crew(task: str, priority: str, output: str):
             "error": str(e)
         }
         
-        with open(output, 'w') as f:
-            json.dump(output_data, f, indent=2)
+        _write_output(output, output_data)
         
         return 1
 
 
+def _batch_output_path(output: str, index: int) -> str:
+    """Derive a per-task output path, e.g. crew-output.json -> crew-output-2.json"""
+    path = Path(output)
+    return str(path.with_name(f"{path.stem}-{index}{path.suffix}"))
+
+
+async def run_batch(tasks: list, priority: str, output: str, max_concurrency: int = 3) -> int:
+    """
+    Run one development crew per task concurrently.
+    
+    Crews spend nearly all of their time waiting on LLM calls, so each one runs
+    in a worker thread, with at most ``max_concurrency`` crews in flight.
+    
+    Returns:
+        0 if every crew succeeded, 1 otherwise
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+    
+    async def run_one(index: int, task: str) -> int:
+        async with sem:
+            return await asyncio.to_thread(
+                run_development_crew, task, priority, _batch_output_path(output, index)
+            )
+    
+    results = await asyncio.gather(
+        *(run_one(index, task) for index, task in enumerate(tasks, 1))
+    )
+    return max(results, default=0)
+
+
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Run CrewAI development crew for automated software development'
     )
     parser.add_argument(
         '--task',
         type=str,
+        action='append',
         required=True,
-        help='Development task to work on'
+        help='Development task to work on (repeat to run several crews concurrently)'
     )
     parser.add_argument(
         '--priority',
@@ -203,13 +262,26 @@ def main():
         '--output',
         type=str,
         default='crew-output.json',
-        help='Output file path'
+        help='Output file path (numbered per task when several tasks are given)'
+    )
+    parser.add_argument(
+        '--parallel-agents',
+        type=int,
+        default=3,
+        help='Maximum number of crews to run at once when several tasks are given'
     )
     
     args = parser.parse_args()
     
-    return run_development_crew(args.task, args.priority, args.output)
+    if len(args.task) == 1:
+        return run_development_crew(args.task[0], args.priority, args.output)
+    
+    return asyncio.run(
+        run_batch(args.task, args.priority, args.output, max(1, args.parallel_agents))
+    )
 
 
 if __name__ == '__main__':
+    # Add parent directory to path for imports (only when run as a script)
+    sys.path.insert(0, str(Path(__file__).parent.parent))
     sys.exit(main())
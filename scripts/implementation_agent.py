@@ -5,9 +5,6 @@ Implementation Agent - Implements code improvements based on research
 
 import argparse
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
 def implement_improvements(research_file: str, target: str):
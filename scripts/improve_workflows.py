@@ -4,11 +4,41 @@ Workflow Improvement Script - Analyzes and improves GitHub Actions workflows
 """
 
 import argparse
+import hashlib
+import re
 import sys
-import yaml
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from json_cache import load_json_cache, save_json_cache
+
+# Everything analyze_workflow looks for, matched in a single scan over the raw
+# bytes. Only a top-level (unindented) concurrency key counts as workflow-level
+# concurrency.
+_WORKFLOW_RE = re.compile(
+    rb"(?P<checkout_v3>actions/checkout@v3)"
+    rb"|(?P<setup_python>actions/setup-python@)"
+    rb"|(?P<cache>cache:)"
+    rb"|(?P<concurrency>^concurrency:)",
+    re.M,
+)
+
+# Rewrites applied by improve_workflow in one substitution pass: bump checkout@v3,
+# and give setup-python steps that have no ``with:`` block a pip cache. ``eol``
+# captures a CRLF line's "\r" so the inserted lines use the same line ending.
+_IMPROVE_RE = re.compile(
+    r"actions/checkout@v3"
+    r"|^(?P<prefix>[ \t]*(?:-[ \t]+)?)uses: actions/setup-python@v5[ \t]*"
+    r"(?=(?P<eol>\r?)$)(?!\r?\n[ \t]*with:)",
+    re.M,
+)
+
+# Analyses from earlier runs, keyed by workflow path and stamped with mtime/size
+CACHE_PATH = Path(__file__).resolve().parent.parent / ".cache" / "workflow_analysis.json"
+
+# Bump ANALYSIS_VERSION whenever analyze_workflow's rules change. The cache is
+# discarded when its version differs; edits to _WORKFLOW_RE change it automatically.
+ANALYSIS_VERSION = 1
+CACHE_VERSION = f"{ANALYSIS_VERSION}:{hashlib.sha1(_WORKFLOW_RE.pattern).hexdigest()[:12]}"
 
 
 def analyze_workflow(filepath: Path) -> dict:
@@ -16,25 +46,25 @@ def analyze_workflow(filepath: Path) -> dict:
     improvements = []
     
     try:
-        with open(filepath, 'r') as f:
-            workflow = yaml.safe_load(f)
+        # All needles are ASCII, so scan the bytes without decoding to str
+        content = filepath.read_bytes()
+        
+        # One pass over the file, remembering where each pattern first occurs
+        found = {}
+        for match in _WORKFLOW_RE.finditer(content):
+            found.setdefault(match.lastgroup, match.start())
         
         # Check for outdated actions
-        content = filepath.read_text()
-        if 'actions/checkout@v3' in content:
-            # Find line number safely
-            lines = content.split('\n')
-            for i, line in enumerate(lines):
-                if 'actions/checkout@v3' in line:
-                    improvements.append({
-                        'type': 'outdated_action',
-                        'message': 'Update to actions/checkout@v4',
-                        'line': i + 1
-                    })
-                    break
+        if 'checkout_v3' in found:
+            # Line number = newlines before the match, without splitting the file
+            improvements.append({
+                'type': 'outdated_action',
+                'message': 'Update to actions/checkout@v4',
+                'line': content.count(b'\n', 0, found['checkout_v3']) + 1
+            })
         
         # Check for missing caching
-        if 'actions/setup-python@' in content and 'cache:' not in content:
+        if 'setup_python' in found and 'cache' not in found:
             improvements.append({
                 'type': 'missing_cache',
                 'message': 'Add pip caching to speed up workflow',
@@ -42,7 +72,7 @@ def analyze_workflow(filepath: Path) -> dict:
             })
         
         # Check for missing concurrency
-        if 'concurrency' not in workflow:
+        if 'concurrency' not in found:
             improvements.append({
                 'type': 'missing_concurrency',
                 'message': 'Add concurrency control to cancel outdated runs',
@@ -63,6 +93,30 @@ def analyze_workflow(filepath: Path) -> dict:
         }
 
 
+def analyze_workflow_cached(filepath: Path, cache: dict) -> dict:
+    """Return the cached analysis of *filepath* if it is unchanged, else analyze it"""
+    st = filepath.stat()
+    key = str(filepath.resolve())
+    entry = cache.get(key)
+    if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+        return entry['analysis']
+    
+    analysis = analyze_workflow(filepath)
+    if 'error' not in analysis:
+        cache[key] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'analysis': analysis}
+    return analysis
+
+
+def _improve_sub(match: re.Match) -> str:
+    prefix = match.group('prefix')
+    if prefix is None:
+        return 'actions/checkout@v4'
+    # Align "with:" under "uses:", whether or not the step starts with "- "
+    indent = ' ' * len(prefix)
+    eol = match.group('eol') + '\n'
+    return f"{match.group(0)}{eol}{indent}with:{eol}{indent}  cache: pip"
+
+
 def improve_workflow(input_file: Path, output_file: Path) -> bool:
     """Apply improvements to a workflow file"""
     try:
@@ -70,17 +124,7 @@ def improve_workflow(input_file: Path, output_file: Path) -> bool:
             content = f.read()
         
         # Apply improvements
-        improved = content
-        
-        # Update checkout action
-        improved = improved.replace('actions/checkout@v3', 'actions/checkout@v4')
-        
-        # Add caching if missing
-        if 'actions/setup-python@' in improved and 'cache:' not in improved:
-            improved = improved.replace(
-                'uses: actions/setup-python@v5',
-                'uses: actions/setup-python@v5\n        with:\n          cache: pip'
-            )
+        improved = _IMPROVE_RE.sub(_improve_sub, content)
         
         # Write improved version
         output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -98,6 +142,9 @@ def main():
     parser = argparse.ArgumentParser(description='Improve GitHub Actions workflows')
     parser.add_argument('--input', type=str, required=True, help='Input directory')
     parser.add_argument('--output', type=str, required=True, help='Output directory')
+    parser.add_argument(
+        '--no-cache', action='store_true', help='Re-analyze every workflow, ignoring the cache'
+    )
     
     args = parser.parse_args()
     
@@ -112,17 +159,18 @@ def main():
         print(f"❌ No workflow files found in {input_dir}")
         return 1
     
-    analyses = []
+    cache = {} if args.no_cache else load_json_cache(CACHE_PATH, CACHE_VERSION)
     improved_count = 0
+    total_score = 0
     
     for workflow_file in workflow_files:
         print(f"\n📋 Analyzing: {workflow_file.name}")
         
         # Analyze
-        analysis = analyze_workflow(workflow_file)
-        analyses.append(analysis)
+        analysis = analyze_workflow_cached(workflow_file, cache)
         
         print(f"   Score: {analysis['score']}/100")
+        total_score += analysis['score']
         if 'improvements' in analysis and analysis['improvements']:
             print(f"   Improvements suggested: {len(analysis['improvements'])}")
             for imp in analysis['improvements']:
@@ -134,12 +182,14 @@ def main():
             improved_count += 1
             print(f"   ✅ Improved version saved to: {output_file}")
     
+    if not args.no_cache:
+        save_json_cache(CACHE_PATH, cache, CACHE_VERSION)
+    
     print(f"\n✅ Analysis complete!")
     print(f"📊 Analyzed {len(workflow_files)} workflows")
     print(f"🔧 Improved {improved_count} workflows")
     
-    # Calculate average score
-    avg_score = sum(a['score'] for a in analyses) / len(analyses)
+    avg_score = total_score / len(workflow_files)
     print(f"📈 Average workflow quality score: {avg_score:.1f}/100")
     
     return 0
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+JSON cache files shared by the scripts in this directory (kept under .cache/)
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+
+def load_json_cache(path: Path, version: Optional[str] = None) -> dict:
+    """
+    Load a cache file, treating a missing or corrupt file as empty.
+
+    With *version*, the file must have been saved with the same version;
+    a cache written by any other version is discarded.
+    """
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if version is None:
+        return data
+    if not isinstance(data, dict) or data.get('version') != version:
+        return {}
+    return data.get('entries', {})
+
+
+def save_json_cache(path: Path, entries: dict, version: Optional[str] = None):
+    """Write a cache file atomically so an interrupted run never leaves a truncated file"""
+    data: Any = entries if version is None else {'version': version, 'entries': entries}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.tmp')
+    tmp.write_text(json.dumps(data, indent=2, sort_keys=True))
+    os.replace(tmp, path)
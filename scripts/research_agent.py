@@ -6,9 +6,73 @@ Research Agent - Gathers information and best practices for code improvements
 import argparse
 import json
 import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Placeholder research (in production, this would use APIs/web search)
+_RESEARCH_FINDINGS = {
+    "recommendations": [
+        {
+            "category": "Code Quality",
+            "items": [
+                "Use type hints for better code documentation",
+                "Add comprehensive docstrings to all public functions",
+                "Follow PEP 8 style guidelines",
+                "Use meaningful variable and function names"
+            ]
+        },
+        {
+            "category": "Testing",
+            "items": [
+                "Aim for 80%+ test coverage",
+                "Write unit tests for all functions",
+                "Add integration tests for API endpoints",
+                "Use pytest fixtures for test setup"
+            ]
+        },
+        {
+            "category": "Performance",
+            "items": [
+                "Use async/await for I/O operations",
+                "Implement caching where appropriate",
+                "Optimize database queries",
+                "Profile code to identify bottlenecks"
+            ]
+        },
+        {
+            "category": "Security",
+            "items": [
+                "Validate all user inputs",
+                "Use parameterized queries to prevent SQL injection",
+                "Keep dependencies up to date",
+                "Implement proper authentication and authorization"
+            ]
+        }
+    ],
+    "best_practices": [
+        "Use virtual environments for Python projects",
+        "Implement continuous integration and deployment",
+        "Write clear commit messages",
+        "Document API endpoints with OpenAPI/Swagger",
+        "Use environment variables for configuration"
+    ]
+}
+
+
+def _render_findings(findings: dict) -> str:
+    """Render the recommendations and best practices as markdown"""
+    parts = ["## Recommendations\n\n"]
+    for rec in findings["recommendations"]:
+        parts.append(f"### {rec['category']}\n\n")
+        parts.extend(f"- {item}\n" for item in rec['items'])
+        parts.append("\n")
+    
+    parts.append("## Best Practices\n\n")
+    parts.extend(f"- {practice}\n" for practice in findings["best_practices"])
+    return "".join(parts)
+
+
+# The findings are static, so the report body is rendered once at import
+_REPORT_BODY = _render_findings(_RESEARCH_FINDINGS)
 
 
 def research_code_improvements(topic: str, output: str):
@@ -16,69 +80,7 @@ def research_code_improvements(topic: str, output: str):
     
     print(f"🔍 Researching: {topic}")
     
-    # Placeholder research (in production, this would use APIs/web search)
-    research_findings = {
-        "topic": topic,
-        "recommendations": [
-            {
-                "category": "Code Quality",
-                "items": [
-                    "Use type hints for better code documentation",
-                    "Add comprehensive docstrings to all public functions",
-                    "Follow PEP 8 style guidelines",
-                    "Use meaningful variable and function names"
-                ]
-            },
-            {
-                "category": "Testing",
-                "items": [
-                    "Aim for 80%+ test coverage",
-                    "Write unit tests for all functions",
-                    "Add integration tests for API endpoints",
-                    "Use pytest fixtures for test setup"
-                ]
-            },
-            {
-                "category": "Performance",
-                "items": [
-                    "Use async/await for I/O operations",
-                    "Implement caching where appropriate",
-                    "Optimize database queries",
-                    "Profile code to identify bottlenecks"
-                ]
-            },
-            {
-                "category": "Security",
-                "items": [
-                    "Validate all user inputs",
-                    "Use parameterized queries to prevent SQL injection",
-                    "Keep dependencies up to date",
-                    "Implement proper authentication and authorization"
-                ]
-            }
-        ],
-        "best_practices": [
-            "Use virtual environments for Python projects",
-            "Implement continuous integration and deployment",
-            "Write clear commit messages",
-            "Document API endpoints with OpenAPI/Swagger",
-            "Use environment variables for configuration"
-        ]
-    }
-    
-    # Generate markdown report
-    markdown = f"# Research Report: {topic}\n\n"
-    markdown += "## Recommendations\n\n"
-    
-    for rec in research_findings["recommendations"]:
-        markdown += f"### {rec['category']}\n\n"
-        for item in rec['items']:
-            markdown += f"- {item}\n"
-        markdown += "\n"
-    
-    markdown += "## Best Practices\n\n"
-    for practice in research_findings["best_practices"]:
-        markdown += f"- {practice}\n"
+    markdown = f"# Research Report: {topic}\n\n" + _REPORT_BODY
     
     # Save report
     with open(output, 'w') as f:
@@ -5,9 +5,6 @@ Review Agent - Reviews code changes and provides feedback
 
 import argparse
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
 def review_code(target: str, output: str):
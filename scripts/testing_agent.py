@@ -5,9 +5,6 @@ Testing Agent - Generates comprehensive tests to improve coverage
 
 import argparse
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
 def generate_tests(source: str, output: str, coverage_target: int):
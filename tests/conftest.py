@@ -0,0 +1,7 @@
+"""Shared pytest configuration."""
+
+import os
+
+# Test databases are throwaway, so let sqlite_conn skip fsyncs
+# (see arb_finder.FAST_DB_PRAGMAS)
+os.environ.setdefault("ARBF_TEST_FAST_DB", "1")
@@ -2,41 +2,35 @@
 Tests for API endpoints
 """
 
-import os
-import tempfile
+from unittest.mock import patch
 
 import pytest
-from fastapi.testclient import TestClient
 
 
 @pytest.fixture(scope="module")
-def setup_test_db():
+def setup_test_db(tmp_path_factory):
     """Setup test database"""
     from backend.arb_finder import db_init
 
-    # Create a temporary database
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as tmp:
-        db_path = tmp.name
+    db_path = str(tmp_path_factory.mktemp("api") / "test.db")
 
     # Initialize database (returns None)
     db_init(db_path)
 
-    # Set environment variable for the API
-    os.environ["ARBF_DB"] = db_path
+    return db_path
 
-    yield db_path
 
-    # Cleanup
-    if os.path.exists(db_path):
-        os.remove(db_path)
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(setup_test_db):
-    """Create test client"""
+    """Create one test client for the module, pointed at the test database"""
+    # Imported here so collecting this module doesn't load starlette/httpx
+    from fastapi.testclient import TestClient
+
+    import backend.api.main as api_main
     from backend.api.main import app
 
-    return TestClient(app)
+    with patch.object(api_main, "DB_PATH", setup_test_db):
+        yield TestClient(app)
 
 
 def test_root_endpoint(client):
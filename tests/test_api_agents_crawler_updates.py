@@ -3,9 +3,7 @@
 from __future__ import annotations
 
 import json
-import os
 import sqlite3
-import tempfile
 import time
 from unittest.mock import patch
 
@@ -14,10 +12,9 @@ from fastapi.testclient import TestClient
 
 
 @pytest.fixture(scope="module")
-def test_db_path():
+def test_db_path(tmp_path_factory):
     """Create a temp DB and initialize all required tables."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as f:
-        db_path = f.name
+    db_path = str(tmp_path_factory.mktemp("api") / "test.db")
 
     conn = sqlite3.connect(db_path)
     c = conn.cursor()
@@ -163,10 +160,7 @@ def test_db_path():
     conn.commit()
     conn.close()
 
-    yield db_path
-
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    return db_path
 
 
 @pytest.fixture(scope="module")
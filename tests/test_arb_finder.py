@@ -2,49 +2,39 @@
 Tests for arb_finder module
 """
 
-import os
-import tempfile
-from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+import sqlite3
 
 import pytest
 
 
-def test_db_init_and_tables():
-    """Test database initialization and table structure"""
-    import sqlite3
-
+@pytest.fixture(scope="module")
+def initialized_db(tmp_path_factory):
+    """Database created once by db_init and shared by the schema checks"""
     from backend.arb_finder import db_init
 
-    # Create a temporary database file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as tmp:
-        db_path = tmp.name
-
-    try:
-        # Test database initialization
-        db_init(db_path)
-
-        # Verify tables exist and have correct structure
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # Check tables exist
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = [row[0] for row in cursor.fetchall()]
-        assert "listings" in tables
-        assert "comps" in tables
-
-        # Check listings table structure
-        cursor.execute("PRAGMA table_info(listings)")
-        listings_cols = [row[1] for row in cursor.fetchall()]
-
-        assert "id" in listings_cols
-        assert "title" in listings_cols
-        assert "price" in listings_cols
-        assert "url" in listings_cols
-
-        conn.close()
-    finally:
-        # Cleanup
-        if os.path.exists(db_path):
-            os.remove(db_path)
+    db_path = str(tmp_path_factory.mktemp("arb_finder") / "test.db")
+    db_init(db_path)
+    return db_path
+
+
+@pytest.fixture(scope="module")
+def db_conn(initialized_db):
+    conn = sqlite3.connect(initialized_db)
+    yield conn
+    conn.close()
+
+
+@pytest.mark.parametrize("table", ["listings", "comps"])
+def test_db_init_creates_table(db_conn, table):
+    """Test database initialization creates each table"""
+    row = db_conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table,)
+    ).fetchone()
+    assert row is not None
+
+
+@pytest.mark.parametrize("column", ["id", "title", "price", "url"])
+def test_db_init_listings_columns(db_conn, column):
+    """Test the listings table has the expected columns"""
+    columns = [row[1] for row in db_conn.execute("PRAGMA table_info(listings)")]
+    assert column in columns
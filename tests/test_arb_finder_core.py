@@ -7,7 +7,6 @@ import json
 import os
 import sqlite3
 import sys
-import tempfile
 import time
 from pathlib import Path
 from typing import Any, Dict, List
@@ -26,23 +25,27 @@ from backend.arb_finder import (
     compute_comps,
     db_init,
     db_upsert_comp,
+    db_upsert_comps,
     db_upsert_listing,
+    db_upsert_listings,
     export_csv,
     export_json,
     match_comps_to_live,
     sqlite_conn,
 )
 
+# Only the tables db_init creates, filtered in SQLite rather than in Python
+SCHEMA_TABLES_QUERY = (
+    "SELECT name FROM sqlite_master WHERE type='table' AND name IN ('listings', 'comps')"
+)
+
 
 @pytest.fixture
-def temp_db():
+def temp_db(tmp_path):
     """Temporary database for testing."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as f:
-        db_path = f.name
+    db_path = str(tmp_path / "test.db")
     db_init(db_path)
-    yield db_path
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    return db_path
 
 
 class TestListing:
@@ -104,31 +107,54 @@ class TestSqliteConn:
         with pytest.raises(Exception):
             conn.execute("SELECT 1")
 
+    def test_sqlite_conn_fast_db_pragmas(self, temp_db, monkeypatch):
+        monkeypatch.setenv("ARBF_TEST_FAST_DB", "1")
+        with sqlite_conn(temp_db) as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+
+    def test_sqlite_conn_default_pragmas(self, temp_db, monkeypatch):
+        monkeypatch.delenv("ARBF_TEST_FAST_DB", raising=False)
+        with sqlite_conn(temp_db) as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] != 0
+
 
 class TestDbInit:
     """Tests for db_init function."""
 
-    def test_creates_listings_table(self, temp_db):
+    def test_idempotent_init(self, temp_db):
+        """Should not raise if tables already exist."""
+        db_init(temp_db)  # Second init should not fail
         conn = sqlite3.connect(temp_db)
-        tables = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+        tables = {row[0] for row in conn.execute(SCHEMA_TABLES_QUERY)}
         conn.close()
-        table_names = [t[0] for t in tables]
-        assert "listings" in table_names
-
-    def test_creates_comps_table(self, temp_db):
+        assert tables == {"listings", "comps"}
+
+    def test_repeat_init_skips_schema(self, temp_db):
+        """A database already initialized in this process isn't reopened."""
+        with patch("backend.arb_finder.sqlite_conn") as mock_conn:
+            db_init(temp_db)
+        mock_conn.assert_not_called()
+
+    def test_reinit_after_file_replaced(self, temp_db):
+        """A different file moved onto the same path gets the tables again."""
+        replacement = temp_db + ".new"
+        sqlite3.connect(replacement).close()
+        os.replace(replacement, temp_db)
+        db_init(temp_db)
         conn = sqlite3.connect(temp_db)
-        tables = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+        tables = {row[0] for row in conn.execute(SCHEMA_TABLES_QUERY)}
         conn.close()
-        table_names = [t[0] for t in tables]
-        assert "comps" in table_names
+        assert tables == {"listings", "comps"}
 
-    def test_idempotent_init(self, temp_db):
-        """Should not raise if tables already exist."""
-        db_init(temp_db)  # Second init should not fail
+    def test_reinit_after_file_removed(self, temp_db):
+        """Removing the file makes the next db_init recreate the tables."""
+        os.remove(temp_db)
+        db_init(temp_db)
         conn = sqlite3.connect(temp_db)
-        count = conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table'").fetchone()[0]
+        tables = {row[0] for row in conn.execute(SCHEMA_TABLES_QUERY)}
         conn.close()
-        assert count >= 2
+        assert tables == {"listings", "comps"}
 
 
 class TestDbUpsertListing:
@@ -178,6 +204,22 @@ class TestDbUpsertListing:
         meta = json.loads(row[0])
         assert meta["q"] == "iPad"
 
+    def test_batch_upsert(self, temp_db):
+        listings = [
+            Listing("ebay", f"http://ebay.com/{i}", f"Item {i}", 10.0 * i) for i in range(5)
+        ]
+        listings.append(Listing("ebay", "http://ebay.com/0", "Item 0 Updated", 1.0))
+        db_upsert_listings(temp_db, listings)
+
+        conn = sqlite3.connect(temp_db)
+        count = conn.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+        title = conn.execute(
+            "SELECT title FROM listings WHERE url=?", ("http://ebay.com/0",)
+        ).fetchone()[0]
+        conn.close()
+        assert count == 5
+        assert title == "Item 0 Updated"
+
 
 class TestDbUpsertComp:
     """Tests for db_upsert_comp function."""
@@ -214,6 +256,14 @@ class TestDbUpsertComp:
         assert row[0] == 260.0
         assert row[1] == 6
 
+    def test_batch_upsert_comps(self, temp_db):
+        db_upsert_comps(temp_db, [Comp("a", 1.0, 1.0, 1), Comp("b", 2.0, 2.0, 2)])
+
+        conn = sqlite3.connect(temp_db)
+        count = conn.execute("SELECT COUNT(*) FROM comps").fetchone()[0]
+        conn.close()
+        assert count == 2
+
 
 class TestComputeComps:
     """Tests for compute_comps function."""
@@ -329,86 +379,62 @@ class TestMatchCompsToLive:
 class TestExportCsv:
     """Tests for export_csv function."""
 
-    def test_export_csv_creates_file(self):
+    def test_export_csv_creates_file(self, tmp_path):
         rows = [
             {"title": "RTX 3060", "price": 200.0, "url": "http://example.com", "source": "test"}
         ]
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".csv", mode="w") as f:
-            csv_path = f.name
-
-        try:
-            export_csv(rows, csv_path)
-            assert os.path.exists(csv_path)
-            with open(csv_path, newline="") as f:
-                reader = csv.DictReader(f)
-                data = list(reader)
-            assert len(data) == 1
-            assert data[0]["title"] == "RTX 3060"
-        finally:
-            if os.path.exists(csv_path):
-                os.remove(csv_path)
-
-    def test_export_csv_empty_rows(self):
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as f:
-            csv_path = f.name
-        try:
-            export_csv([], csv_path)
-            # File exists but is empty (function returns early)
-        finally:
-            if os.path.exists(csv_path):
-                os.remove(csv_path)
-
-    def test_export_csv_multiple_rows(self):
+        csv_path = tmp_path / "out.csv"
+
+        export_csv(rows, str(csv_path))
+        assert csv_path.exists()
+        with open(csv_path, newline="") as f:
+            reader = csv.DictReader(f)
+            data = list(reader)
+        assert len(data) == 1
+        assert data[0]["title"] == "RTX 3060"
+
+    def test_export_csv_empty_rows(self, tmp_path):
+        csv_path = tmp_path / "out.csv"
+        export_csv([], str(csv_path))
+        # Function returns early without writing a file
+        assert not csv_path.exists()
+
+    def test_export_csv_multiple_rows(self, tmp_path):
         rows = [
             {"title": "Item 1", "price": 100.0},
             {"title": "Item 2", "price": 200.0},
             {"title": "Item 3", "price": 300.0},
         ]
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".csv", mode="w") as f:
-            csv_path = f.name
+        csv_path = tmp_path / "out.csv"
 
-        try:
-            export_csv(rows, csv_path)
-            with open(csv_path, newline="") as f:
-                reader = csv.DictReader(f)
-                data = list(reader)
-            assert len(data) == 3
-        finally:
-            if os.path.exists(csv_path):
-                os.remove(csv_path)
+        export_csv(rows, str(csv_path))
+        with open(csv_path, newline="") as f:
+            reader = csv.DictReader(f)
+            data = list(reader)
+        assert len(data) == 3
 
 
 class TestExportJson:
     """Tests for export_json function."""
 
-    def test_export_json_creates_file(self):
+    def test_export_json_creates_file(self, tmp_path):
         rows = [{"title": "RTX 3060", "price": 200.0}]
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".json", mode="w") as f:
-            json_path = f.name
-
-        try:
-            export_json(rows, json_path)
-            assert os.path.exists(json_path)
-            with open(json_path) as f:
-                data = json.load(f)
-            assert len(data) == 1
-            assert data[0]["title"] == "RTX 3060"
-        finally:
-            if os.path.exists(json_path):
-                os.remove(json_path)
-
-    def test_export_json_empty_rows(self):
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".json", mode="w") as f:
-            json_path = f.name
-
-        try:
-            export_json([], json_path)
-            with open(json_path) as f:
-                data = json.load(f)
-            assert data == []
-        finally:
-            if os.path.exists(json_path):
-                os.remove(json_path)
+        json_path = tmp_path / "out.json"
+
+        export_json(rows, str(json_path))
+        assert json_path.exists()
+        with open(json_path) as f:
+            data = json.load(f)
+        assert len(data) == 1
+        assert data[0]["title"] == "RTX 3060"
+
+    def test_export_json_empty_rows(self, tmp_path):
+        json_path = tmp_path / "out.json"
+
+        export_json([], str(json_path))
+        with open(json_path) as f:
+            data = json.load(f)
+        assert data == []
 
 
 class TestManualImport:
@@ -422,10 +448,11 @@ class TestManualImport:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_manual_import_csv(self):
+    async def test_manual_import_csv(self, tmp_path):
         client = MagicMock()
+        csv_path = tmp_path / "import.csv"
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".csv", mode="w", newline="") as f:
+        with open(csv_path, "w", newline="") as f:
             writer = csv.DictWriter(
                 f, fieldnames=["title", "price", "url", "currency", "condition"]
             )
@@ -448,78 +475,57 @@ class TestManualImport:
                     "condition": "good",
                 }
             )
-            csv_path = f.name
-
-        try:
-            provider = ManualImport(client, path=csv_path)
-            result = await provider.search("test")
-            assert len(result) == 2
-            assert result[0].title == "RTX 3060"
-            assert result[0].price == 250.0
-        finally:
-            if os.path.exists(csv_path):
-                os.remove(csv_path)
+
+        provider = ManualImport(client, path=str(csv_path))
+        result = await provider.search("test")
+        assert len(result) == 2
+        assert result[0].title == "RTX 3060"
+        assert result[0].price == 250.0
 
     @pytest.mark.asyncio
-    async def test_manual_import_json(self):
+    async def test_manual_import_json(self, tmp_path):
         client = MagicMock()
 
         data = [
             {"title": "RTX 3060", "price": 250.0, "url": "http://example.com/1"},
             {"title": "iPad Pro", "price": 400.0, "url": "http://example.com/2"},
         ]
+        json_path = tmp_path / "import.json"
+        json_path.write_text(json.dumps(data))
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".json", mode="w") as f:
-            json.dump(data, f)
-            json_path = f.name
-
-        try:
-            provider = ManualImport(client, path=json_path)
-            result = await provider.search("test")
-            assert len(result) == 2
-            assert result[0].title == "RTX 3060"
-        finally:
-            if os.path.exists(json_path):
-                os.remove(json_path)
+        provider = ManualImport(client, path=str(json_path))
+        result = await provider.search("test")
+        assert len(result) == 2
+        assert result[0].title == "RTX 3060"
 
     @pytest.mark.asyncio
-    async def test_manual_import_respects_limit(self):
+    async def test_manual_import_respects_limit(self, tmp_path):
         client = MagicMock()
         data = [
             {"title": f"Item {i}", "price": float(i * 10), "url": f"http://e.com/{i}"}
             for i in range(10)
         ]
+        json_path = tmp_path / "import.json"
+        json_path.write_text(json.dumps(data))
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".json", mode="w") as f:
-            json.dump(data, f)
-            json_path = f.name
-
-        try:
-            provider = ManualImport(client, path=json_path)
-            result = await provider.search("test", limit=3)
-            assert len(result) == 3
-        finally:
-            if os.path.exists(json_path):
-                os.remove(json_path)
+        provider = ManualImport(client, path=str(json_path))
+        result = await provider.search("test", limit=3)
+        assert len(result) == 3
 
     @pytest.mark.asyncio
-    async def test_manual_import_csv_invalid_price(self):
+    async def test_manual_import_csv_invalid_price(self, tmp_path):
         client = MagicMock()
+        csv_path = tmp_path / "import.csv"
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".csv", mode="w", newline="") as f:
+        with open(csv_path, "w", newline="") as f:
             writer = csv.DictWriter(f, fieldnames=["title", "price", "url"])
             writer.writeheader()
             writer.writerow({"title": "Item", "price": "not_a_price", "url": "http://e.com/1"})
-            csv_path = f.name
 
-        try:
-            provider = ManualImport(client, path=csv_path)
-            result = await provider.search("test")
-            # Invalid price should be skipped
-            assert len(result) == 0
-        finally:
-            if os.path.exists(csv_path):
-                os.remove(csv_path)
+        provider = ManualImport(client, path=str(csv_path))
+        result = await provider.search("test")
+        # Invalid price should be skipped
+        assert len(result) == 0
 
 
 class TestPriceRegex:
@@ -600,3 +606,17 @@ class TestBuildParser:
         assert args.threshold_pct == 30.0
         assert args.csv == "output.csv"
         assert args.json == "output.json"
+
+
+class TestInstallEventLoopPolicy:
+    """Tests for the optional uvloop event loop policy."""
+
+    def test_noop_without_uvloop(self, monkeypatch):
+        import asyncio
+
+        import backend.arb_finder as arb_finder
+
+        monkeypatch.setattr(arb_finder, "UVLOOP_AVAILABLE", False)
+        policy = asyncio.get_event_loop_policy()
+        assert arb_finder.install_event_loop_policy() is False
+        assert asyncio.get_event_loop_policy() is policy
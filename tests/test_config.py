@@ -1,12 +1,38 @@
 """Test configuration module."""
 
-import json
-import tempfile
+import io
 from pathlib import Path
 
 import pytest
 from arbfinder import config as config_module
 
+CONFIG_UPDATES = [
+    {"threshold_pct": 35.0},
+    {"live_limit": 100},
+    {"threshold_pct": 50.0, "new_key": "new_value"},
+    {"search_query": "Café Ω 東京"},
+]
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """Path to a not-yet-created config file in the per-test temp dir."""
+    return str(tmp_path / "cfg.json")
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(True, id="orjson"),
+        pytest.param(False, id="stdlib-json"),
+    ]
+)
+def json_backend(request, monkeypatch):
+    """Run a test against both the orjson and the stdlib json code paths."""
+    if request.param and not config_module.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(config_module, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
 
 def test_default_config():
     """Test default configuration values."""
@@ -19,83 +45,133 @@ def test_default_config():
     assert config["watch_interval"] == 3600
 
 
-def test_load_nonexistent_config():
+def test_load_nonexistent_config(config_path):
     """Test loading non-existent config returns defaults."""
-    with tempfile.NamedTemporaryFile(mode="w", delete=True, suffix=".json") as f:
-        config_path = f.name + "_nonexistent"
-        config = config_module.load_config(config_path)
+    config = config_module.load_config(config_path)
 
-        assert config == config_module.DEFAULT_CONFIG
+    assert config == config_module.DEFAULT_CONFIG
 
 
-def test_save_and_load_config():
+@pytest.mark.parametrize("updates", CONFIG_UPDATES)
+def test_save_and_load_config(config_path, updates, json_backend):
     """Test saving and loading configuration."""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-        config_path = f.name
-
-    try:
-        test_config = config_module.DEFAULT_CONFIG.copy()
-        test_config["threshold_pct"] = 35.0
-        test_config["live_limit"] = 100
+    test_config = {**config_module.DEFAULT_CONFIG, **updates}
 
-        # Save config
-        result = config_module.save_config(test_config, config_path)
-        assert result is True
+    # Save config
+    result = config_module.save_config(test_config, config_path)
+    assert result is True
 
-        # Load config
-        loaded_config = config_module.load_config(config_path)
-        assert loaded_config["threshold_pct"] == 35.0
-        assert loaded_config["live_limit"] == 100
-    finally:
-        Path(config_path).unlink(missing_ok=True)
+    # Load config
+    loaded_config = config_module.load_config(config_path)
+    for key, value in updates.items():
+        assert loaded_config[key] == value
 
 
-def test_update_config():
+@pytest.mark.parametrize("updates", CONFIG_UPDATES)
+def test_update_config(config_path, updates, json_backend):
     """Test updating configuration."""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-        config_path = f.name
+    # Create initial config
+    config_module.save_config(config_module.DEFAULT_CONFIG, config_path)
 
-    try:
-        # Create initial config
-        config_module.save_config(config_module.DEFAULT_CONFIG, config_path)
+    # Update config
+    updated_config = config_module.update_config(updates, config_path)
 
-        # Update config
-        updates = {"threshold_pct": 50.0, "new_key": "new_value"}
-        updated_config = config_module.update_config(updates, config_path)
+    # Verify it was applied and saved
+    loaded_config = config_module.load_config(config_path)
+    for key, value in updates.items():
+        assert updated_config[key] == value
+        assert loaded_config[key] == value
 
-        assert updated_config["threshold_pct"] == 50.0
-        assert updated_config["new_key"] == "new_value"
 
-        # Verify it was saved
-        loaded_config = config_module.load_config(config_path)
-        assert loaded_config["threshold_pct"] == 50.0
-        assert loaded_config["new_key"] == "new_value"
-    finally:
-        Path(config_path).unlink(missing_ok=True)
+def test_create_default_config(config_path):
+    """Test creating default config file."""
+    # Create default config
+    result = config_module.create_default_config(config_path)
+    assert result is True
 
+    # Verify file was created
+    assert Path(config_path).exists()
 
-def test_create_default_config():
-    """Test creating default config file."""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-        config_path = f.name
+    # Load and verify content
+    loaded_config = config_module.load_config(config_path)
+    assert loaded_config == config_module.DEFAULT_CONFIG
+
+    # Try creating again (should fail)
+    result = config_module.create_default_config(config_path)
+    assert result is False
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.param(config_module.DEFAULT_CONFIG, id="defaults"),
+        pytest.param({"search_query": "Café Ω 東京"}, id="non-ascii"),
+        pytest.param({"limits": {1: 10, 2: 20}}, id="int-keys"),
+        pytest.param({"ratios": [0.5, 1e16, 1e-05, 5e-324, -0.0]}, id="floats"),
+        pytest.param({"threshold_pct": float("nan"), "max": float("inf")}, id="non-finite"),
+        pytest.param({"big": 2**64, "small": -(2**63) - 1}, id="big-ints"),
+    ],
+)
+def test_json_backends_write_identical_files(tmp_path, monkeypatch, config):
+    """orjson output matches json.dump(indent=2), so either can read the other's file."""
+    if not config_module.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    orjson_path = tmp_path / "orjson.json"
+    stdlib_path = tmp_path / "stdlib.json"
+
+    config_module.save_config(config, str(orjson_path))
+    monkeypatch.setattr(config_module, "ORJSON_AVAILABLE", False)
+    config_module.save_config(config, str(stdlib_path))
+
+    assert orjson_path.read_bytes() == stdlib_path.read_bytes()
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.param({"threshold_pct": float("inf"), "min": float("-inf")}, id="non-finite"),
+        pytest.param({"big": 2**64}, id="big-ints"),
+    ],
+)
+def test_values_orjson_cannot_write_round_trip(config_path, json_backend, config):
+    """Values outside what orjson supports are saved and loaded back unchanged."""
+    assert config_module.save_config(config, config_path) is True
+
+    loaded_config = config_module.load_config(config_path)
+    for key, value in config.items():
+        assert loaded_config[key] == value
+
+
+def test_create_default_config_encode_failure_leaves_no_file(config_path, monkeypatch):
+    """A config that fails to encode never creates the file."""
+    monkeypatch.setitem(config_module.DEFAULT_CONFIG, "bad", object())
+
+    assert config_module.create_default_config(config_path) is False
+    assert not Path(config_path).exists()
+
+
+def test_create_default_config_write_failure_removes_file(config_path, monkeypatch):
+    """A failed write removes the new file so a later call can create it."""
+
+    class FailingFile(io.BytesIO):
+        def write(self, data):
+            raise OSError("disk full")
+
+    def failing_open(path, mode):
+        open(path, mode).close()
+        return FailingFile()
 
-    # Delete the file first
-    Path(config_path).unlink()
+    monkeypatch.setattr(config_module, "open", failing_open, raising=False)
+    assert config_module.create_default_config(config_path) is False
+    assert not Path(config_path).exists()
 
-    try:
-        # Create default config
-        result = config_module.create_default_config(config_path)
-        assert result is True
+    monkeypatch.delattr(config_module, "open")
+    assert config_module.create_default_config(config_path) is True
 
-        # Verify file was created
-        assert Path(config_path).exists()
 
-        # Load and verify content
-        loaded_config = config_module.load_config(config_path)
-        assert loaded_config == config_module.DEFAULT_CONFIG
+def test_create_default_config_keeps_existing_file(config_path):
+    """An existing file is reported, never overwritten."""
+    Path(config_path).write_text('{"live_limit": 5}')
 
-        # Try creating again (should fail)
-        result = config_module.create_default_config(config_path)
-        assert result is False
-    finally:
-        Path(config_path).unlink(missing_ok=True)
+    assert config_module.create_default_config(config_path) is False
+    assert config_module.load_config(config_path)["live_limit"] == 5
@@ -13,11 +13,9 @@ those services are unavailable, so the suite is always safe to run in CI.
 from __future__ import annotations
 
 import json
-import os
 import shutil
 import sqlite3
 import subprocess
-import tempfile
 import time
 from pathlib import Path
 from typing import Any, Dict, List
@@ -105,13 +103,10 @@ def _populate_db(db_path: str) -> None:
 
 
 @pytest.fixture(scope="module")
-def e2e_db():
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as f:
-        db_path = f.name
+def e2e_db(tmp_path_factory):
+    db_path = str(tmp_path_factory.mktemp("e2e") / "e2e.db")
     _populate_db(db_path)
-    yield db_path
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    return db_path
 
 
 @pytest.fixture(scope="module")
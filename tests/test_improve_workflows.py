@@ -0,0 +1,48 @@
+"""Tests for the workflow rewrites in scripts/improve_workflows.py."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# The script imports its sibling json_cache module, so put scripts/ on the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from improve_workflows import _IMPROVE_RE, _improve_sub, improve_workflow
+
+SETUP_PYTHON_STEP = "    steps:\n      - uses: actions/setup-python@v5\n      - run: make\n"
+CACHED_STEP = (
+    "    steps:\n"
+    "      - uses: actions/setup-python@v5\n"
+    "        with:\n"
+    "          cache: pip\n"
+    "      - run: make\n"
+)
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"], ids=["lf", "crlf"])
+def test_setup_python_gets_pip_cache(newline):
+    """A setup-python step without a with: block gets one, in the file's line ending."""
+    content = SETUP_PYTHON_STEP.replace("\n", newline)
+
+    assert _IMPROVE_RE.sub(_improve_sub, content) == CACHED_STEP.replace("\n", newline)
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"], ids=["lf", "crlf"])
+def test_existing_with_block_is_left_alone(newline):
+    """A step that already has a with: block is not given a second one."""
+    content = CACHED_STEP.replace("\n", newline)
+
+    assert _IMPROVE_RE.sub(_improve_sub, content) == content
+
+
+def test_improve_workflow_crlf_file(tmp_path):
+    """A workflow checked out with CRLF endings is rewritten like an LF one."""
+    input_file = tmp_path / "ci.yml"
+    output_file = tmp_path / "out" / "ci.yml"
+    input_file.write_bytes(
+        (SETUP_PYTHON_STEP + "      - uses: actions/checkout@v3\n").replace("\n", "\r\n").encode()
+    )
+
+    assert improve_workflow(input_file, output_file) is True
+    assert output_file.read_text() == CACHED_STEP + "      - uses: actions/checkout@v4\n"
@@ -0,0 +1,71 @@
+"""Tests for scripts/cloudflare/setup_cloudflare.py against a mocked Cloudflare API."""
+
+import importlib.util
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("rich")
+
+SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "cloudflare" / "setup_cloudflare.py"
+ENDPOINT = "/accounts/acct/storage/kv/namespaces"
+
+
+@pytest.fixture(scope="module")
+def setup_cloudflare(tmp_path_factory):
+    """The setup script, imported from a temp dir so its log file lands there."""
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("cloudflare"))
+    try:
+        spec = importlib.util.spec_from_file_location("setup_cloudflare", SCRIPT_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        os.chdir(cwd)
+    return module
+
+
+def _namespace_pages(count, per_page=100):
+    """Fake _make_request serving *count* namespaces, one page per call."""
+    namespaces = [{"title": f"ns-{i}", "id": f"id-{i}"} for i in range(count)]
+
+    def make_request(method, endpoint, data=None, params=None):
+        if method == "POST":
+            return {"id": f"new-{data['title']}"}
+        start = (params["page"] - 1) * params["per_page"]
+        return namespaces[start : start + params["per_page"]]
+
+    return make_request
+
+
+def test_get_all_follows_pages(setup_cloudflare):
+    """Pages are requested until one comes back short."""
+    client = setup_cloudflare.CloudflareAPIClient("token", "acct")
+
+    with patch.object(client, "_make_request", side_effect=_namespace_pages(250)) as request:
+        items = client.get_all(ENDPOINT)
+
+    assert [ns["id"] for ns in items] == [f"id-{i}" for i in range(250)]
+    assert [call.kwargs["params"]["page"] for call in request.call_args_list] == [1, 2, 3]
+
+
+def test_setup_kv_namespaces_skips_existing_on_later_pages(setup_cloudflare):
+    """Namespaces past the first page are reused, and only missing ones are created."""
+    config = setup_cloudflare.CloudflareConfig(
+        api_token="token", account_id="acct", kv_namespaces=["ns-5", "ns-120", "fresh"]
+    )
+    setup = setup_cloudflare.CloudflareSetup(config)
+
+    with patch.object(setup.client, "_make_request", side_effect=_namespace_pages(150)) as request:
+        result = setup.setup_kv_namespaces()
+
+    assert result["namespaces"] == [
+        {"name": "ns-5", "id": "id-5"},
+        {"name": "ns-120", "id": "id-120"},
+        {"name": "fresh", "id": "new-fresh"},
+    ]
+    posts = [call for call in request.call_args_list if call.args[0] == "POST"]
+    assert [call.kwargs["data"]["title"] for call in posts] == ["fresh"]
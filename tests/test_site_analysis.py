@@ -2,11 +2,11 @@
 Tests for site analysis functionality
 """
 
-import asyncio
 import json
 import sys
 from pathlib import Path
 
+import httpx
 import pytest
 
 # Add backend to path
@@ -20,13 +20,72 @@ from site_investigator import (
     SiteInvestigator,
     TermsAnalyzer,
 )
+from site_investigator.investigator import SiteInvestigationReport
+
+OPENAPI_SPEC_DICT = {
+    "paths": {
+        "/users": {
+            "get": {
+                "summary": "Get users",
+                "description": "Retrieve list of users",
+                "parameters": [
+                    {
+                        "name": "limit",
+                        "in": "query",
+                        "type": "integer",
+                        "required": False,
+                    }
+                ],
+            }
+        }
+    }
+}
+OPENAPI_SPEC_JSON = json.dumps(OPENAPI_SPEC_DICT)
+
+# Report that favours the API; test_determine_approach derives the other cases from it
+BASE_REPORT = SiteInvestigationReport(
+    site_name="example",
+    site_url="https://example.com",
+    investigation_date="2024-01-01",
+    robots_allowed=True,
+    api_allowed=True,
+    api_endpoints=[{"path": "/api/test"}],
+)
+
+ROBOTS_TXT = b"""
+User-agent: *
+Disallow: /admin/
+Disallow: /private/
+Allow: /public/
+Crawl-delay: 2
+
+Sitemap: https://example.com/sitemap.xml
+"""
+
+
+@pytest.fixture
+async def http_client():
+    """Client that serves ROBOTS_TXT and 404s everything else, recording request paths"""
+    requested = []
+    read_timeouts = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        read_timeouts[request.url.path] = request.extensions["timeout"]["read"]
+        if request.url.path == "/robots.txt":
+            return httpx.Response(200, content=ROBOTS_TXT)
+        return httpx.Response(404)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        client.requested = requested
+        client.read_timeouts = read_timeouts
+        yield client
 
 
 class TestRobotsAnalyzer:
     """Test robots.txt analysis"""
 
-    @pytest.mark.asyncio
-    async def test_robots_analyzer_basic(self):
+    def test_robots_analyzer_basic(self):
         """Test basic robots.txt analysis"""
         analyzer = RobotsAnalyzer("https://example.com")
 
@@ -34,34 +93,46 @@ class TestRobotsAnalyzer:
         assert analyzer.site_url == "https://example.com"
         assert analyzer.robots_url == "https://example.com/robots.txt"
 
-    @pytest.mark.asyncio
-    async def test_parse_robots_txt(self):
+    def test_parse_robots_txt(self):
         """Test robots.txt parsing"""
         analyzer = RobotsAnalyzer("https://example.com")
 
-        content = """
-User-agent: *
-Disallow: /admin/
-Disallow: /private/
-Allow: /public/
-Crawl-delay: 2
+        result = analyzer._parse_robots_txt(ROBOTS_TXT)
 
-Sitemap: https://example.com/sitemap.xml
-        """
+        assert result["disallowed_paths"] == ["/admin/", "/private/"]
+        assert result["allowed_paths"] == ["/public/"]
+        assert result["crawl_delay"] == 2.0
+        assert result["sitemaps"] == ["https://example.com/sitemap.xml"]
 
-        result = analyzer._parse_robots_txt(content)
+        # Decoded text is still accepted
+        assert analyzer._parse_robots_txt(ROBOTS_TXT.decode()) == result
+
+    async def test_analyze_with_shared_client(self, http_client):
+        """A client passed to the constructor is used for every fetch"""
+        analyzer = RobotsAnalyzer("https://example.com", client=http_client)
+
+        result = await analyzer.analyze()
 
         assert result["disallowed_paths"] == ["/admin/", "/private/"]
-        assert result["allowed_paths"] == ["/public/"]
+        assert result["llms_txt_found"] is False
+        assert http_client.requested == ["/robots.txt", "/llms.txt"]
+        assert not http_client.is_closed
+
+    async def test_analyze_with_per_call_client(self, http_client):
+        """A client passed to analyze() is used for that call only, with per-request timeouts"""
+        analyzer = RobotsAnalyzer("https://example.com")
+
+        result = await analyzer.analyze(client=http_client)
+
         assert result["crawl_delay"] == 2.0
-        assert len(result["sitemaps"]) == 1
+        assert analyzer.client is None
+        assert http_client.read_timeouts == {"/robots.txt": 10.0, "/llms.txt": 10.0}
 
 
 class TestAPIDiscoverer:
     """Test API discovery"""
 
-    @pytest.mark.asyncio
-    async def test_api_discoverer_init(self):
+    def test_api_discoverer_init(self):
         """Test API discoverer initialization"""
         discoverer = APIDiscoverer("https://api.example.com")
 
@@ -72,34 +143,21 @@ class TestAPIDiscoverer:
         """Test OpenAPI specification parsing"""
         discoverer = APIDiscoverer("https://api.example.com")
 
-        spec = json.dumps(
-            {
-                "paths": {
-                    "/users": {
-                        "get": {
-                            "summary": "Get users",
-                            "description": "Retrieve list of users",
-                            "parameters": [
-                                {
-                                    "name": "limit",
-                                    "in": "query",
-                                    "type": "integer",
-                                    "required": False,
-                                }
-                            ],
-                        }
-                    }
-                }
-            }
-        )
-
-        endpoints = discoverer._parse_openapi_spec(spec)
+        endpoints = discoverer._parse_openapi_spec(OPENAPI_SPEC_DICT)
 
         assert len(endpoints) == 1
         assert endpoints[0]["method"] == "GET"
         assert endpoints[0]["path"] == "/users"
         assert len(endpoints[0]["parameters"]) == 1
 
+    def test_parse_openapi_spec_from_json(self):
+        """JSON text is decoded before parsing"""
+        discoverer = APIDiscoverer("https://api.example.com")
+
+        from_json = discoverer._parse_openapi_spec(OPENAPI_SPEC_JSON)
+        assert from_json == discoverer._parse_openapi_spec(OPENAPI_SPEC_DICT)
+        assert discoverer._parse_openapi_spec("not json") == []
+
     def test_detect_base_path(self):
         """Test API base path detection"""
         discoverer = APIDiscoverer("https://api.example.com")
@@ -113,12 +171,31 @@ class TestAPIDiscoverer:
         base_path = discoverer._detect_base_path(endpoints)
         assert base_path in ["/api", "/api/v1"]
 
+    def test_deduplicate_endpoints_keeps_first_in_order(self):
+        """Test endpoint deduplication preserves first-seen order"""
+        discoverer = APIDiscoverer("https://api.example.com")
+
+        endpoints = [
+            {"path": "/api/b", "method": "GET", "source": "openapi"},
+            {"path": "/api/a", "method": "GET"},
+            {"path": "/api/b", "method": "GET", "source": "javascript"},
+            {"path": "/api/b", "method": "POST"},
+        ]
+
+        unique = discoverer._deduplicate_endpoints(endpoints)
+
+        assert [(e["method"], e["path"]) for e in unique] == [
+            ("GET", "/api/b"),
+            ("GET", "/api/a"),
+            ("POST", "/api/b"),
+        ]
+        assert unique[0]["source"] == "openapi"
+
 
 class TestHistoricalDataFetcher:
     """Test historical data fetching"""
 
-    @pytest.mark.asyncio
-    async def test_historical_fetcher_init(self):
+    def test_historical_fetcher_init(self):
         """Test historical data fetcher initialization"""
         fetcher = HistoricalDataFetcher("https://example.com")
 
@@ -132,7 +209,11 @@ class TestHistoricalDataFetcher:
         timestamp = "20240101120000"
         result = fetcher._parse_timestamp(timestamp)
 
-        assert "2024-01-01" in result
+        assert result == "2024-01-01T12:00:00"
+
+        # Out-of-range fields and other shapes are returned unchanged
+        assert fetcher._parse_timestamp("20241301120000") == "20241301120000"
+        assert fetcher._parse_timestamp("not-a-timestamp") == "not-a-timestamp"
 
     def test_build_wayback_url(self):
         """Test Wayback URL construction"""
@@ -148,48 +229,56 @@ class TestHistoricalDataFetcher:
 class TestSiteInvestigator:
     """Test site investigator orchestrator"""
 
-    @pytest.mark.asyncio
-    async def test_investigator_init(self):
+    def test_investigator_init(self, tmp_path):
         """Test investigator initialization"""
+        output_dir = tmp_path / "out"
         investigator = SiteInvestigator(
             site_url="https://example.com",
             site_name="example",
-            output_dir="/tmp/test_output",
+            output_dir=str(output_dir),
         )
 
         assert investigator.site_url == "https://example.com"
         assert investigator.site_name == "example"
-        assert Path("/tmp/test_output").exists()
-
-    def test_determine_approach(self):
-        """Test approach determination logic"""
-        from site_investigator.investigator import SiteInvestigationReport
+        assert output_dir.exists()
 
+    async def test_investigate_with_shared_client(self, tmp_path, http_client):
+        """All analyzers fetch through the investigator's client"""
         investigator = SiteInvestigator(
             site_url="https://example.com",
             site_name="example",
+            output_dir=str(tmp_path),
+            client=http_client,
         )
 
-        # Test API preferred
-        report = SiteInvestigationReport(
-            site_name="example",
+        report = await investigator.investigate()
+
+        assert report.robots_crawl_delay == 2
+        assert "/robots.txt" in http_client.requested
+        assert "/openapi.json" in http_client.requested
+        assert http_client.read_timeouts["/robots.txt"] == 10.0
+        assert http_client.read_timeouts["/openapi.json"] == 15.0
+
+    @pytest.mark.parametrize(
+        "mods,expected",
+        [
+            ({}, "API_PREFERRED"),
+            ({"api_allowed": False, "api_endpoints": [], "scraping_allowed": True}, "WEB_SCRAPING"),
+            ({"api_endpoints": [], "wayback_available": True}, "HISTORICAL_ONLY"),
+            ({"api_endpoints": []}, "MANUAL_EXPORT"),
+        ],
+    )
+    def test_determine_approach(self, tmp_path, mods, expected):
+        """Test approach determination logic"""
+        investigator = SiteInvestigator(
             site_url="https://example.com",
-            investigation_date="2024-01-01",
-            robots_allowed=True,
-            api_allowed=True,
-            api_endpoints=[{"path": "/api/test"}],
+            site_name="example",
+            output_dir=str(tmp_path),
         )
 
-        approach = investigator._determine_approach(report)
-        assert approach == "API_PREFERRED"
-
-        # Test web scraping
-        report.api_allowed = False
-        report.api_endpoints = []
-        report.scraping_allowed = True
+        report = BASE_REPORT.model_copy(update=mods)
 
-        approach = investigator._determine_approach(report)
-        assert approach == "WEB_SCRAPING"
+        assert investigator._determine_approach(report) == expected
 
 
 def test_imports():
@@ -0,0 +1,87 @@
+"""
+Property-based tests for the site analysis parsers
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("hypothesis")
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_dir))
+
+from site_investigator import APIDiscoverer, RobotsAnalyzer
+
+# Strategies are built once at import and shared by every example
+SEGMENTS = st.text(alphabet="abcdefghijklmnopqrstuvwxyz", min_size=1, max_size=10)
+VERSIONED_API_PATHS = st.lists(
+    st.builds("/api/v{}/{}".format, st.integers(min_value=0, max_value=99), SEGMENTS),
+    min_size=2,
+    max_size=10,
+)
+URL_PATHS = st.text(alphabet="abcdefghijklmnopqrstuvwxyz0123456789_/-", max_size=20).map(
+    "/{}".format
+)
+METHODS = st.sampled_from(["get", "post", "put", "delete", "patch", "head", "options"])
+OPENAPI_SPECS = st.dictionaries(
+    URL_PATHS,
+    st.dictionaries(METHODS, st.fixed_dictionaries({"summary": SEGMENTS})),
+    max_size=8,
+).map(lambda paths: {"paths": paths})
+ROBOTS_PATHS = st.lists(URL_PATHS, max_size=10)
+
+PROPERTY_SETTINGS = settings(max_examples=25, deadline=None)
+
+discoverer = APIDiscoverer("https://api.example.com")
+analyzer = RobotsAnalyzer("https://example.com")
+
+
+@PROPERTY_SETTINGS
+@given(paths=VERSIONED_API_PATHS)
+def test_detect_base_path_is_common_prefix(paths):
+    """Versioned /api paths always yield a base path shared by every endpoint"""
+    base = discoverer._detect_base_path([{"path": p} for p in paths])
+
+    assert base is not None
+    assert all(p.startswith(base) for p in paths)
+
+
+@PROPERTY_SETTINGS
+@given(spec=OPENAPI_SPECS)
+def test_parse_openapi_spec_one_endpoint_per_operation(spec):
+    """Every HTTP operation becomes one endpoint, whether given as a dict or JSON"""
+    endpoints = discoverer._parse_openapi_spec(spec)
+
+    expected = {
+        (path, method.upper())
+        for path, methods in spec["paths"].items()
+        for method in methods
+        if method in ("get", "post", "put", "delete", "patch")
+    }
+    assert {(e["path"], e["method"]) for e in endpoints} == expected
+    assert len(endpoints) == len(expected)
+    assert discoverer._parse_openapi_spec(json.dumps(spec)) == endpoints
+
+
+@PROPERTY_SETTINGS
+@given(disallowed=ROBOTS_PATHS, allowed=ROBOTS_PATHS)
+def test_parse_robots_txt_round_trip(disallowed, allowed):
+    """Disallow/Allow rules for * come back in order, from bytes or str"""
+    lines = ["User-agent: *"]
+    lines += [f"Disallow: {path}" for path in disallowed]
+    lines += [f"Allow: {path}" for path in allowed]
+    content = "\n".join(lines).encode()
+
+    result = analyzer._parse_robots_txt(content)
+
+    assert result["disallowed_paths"] == disallowed
+    assert result["allowed_paths"] == allowed
+    assert result["allowed"] == ("/" not in disallowed)
+    assert analyzer._parse_robots_txt(content.decode()) == result
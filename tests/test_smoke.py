@@ -10,9 +10,7 @@ from __future__ import annotations
 
 import importlib
 import json
-import os
 import sqlite3
-import tempfile
 import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -25,10 +23,8 @@ from fastapi.testclient import TestClient
 # ---------------------------------------------------------------------------
 
 
-def _make_temp_db() -> str:
-    """Create a minimal in-memory SQLite database and return its path."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as f:
-        db_path = f.name
+def _make_temp_db(db_path: str) -> str:
+    """Create a minimal SQLite database at *db_path* and return the path."""
     conn = sqlite3.connect(db_path)
     c = conn.cursor()
     c.execute("""CREATE TABLE IF NOT EXISTS listings (
@@ -46,12 +42,9 @@ def _make_temp_db() -> str:
 
 
 @pytest.fixture(scope="module")
-def smoke_db():
+def smoke_db(tmp_path_factory):
     """Temp SQLite database for smoke tests."""
-    db_path = _make_temp_db()
-    yield db_path
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    return _make_temp_db(str(tmp_path_factory.mktemp("smoke") / "smoke.db"))
 
 
 @pytest.fixture(scope="module")
@@ -172,8 +165,10 @@ class TestDatabaseInit:
                 currency TEXT, condition TEXT, ts REAL, meta_json TEXT
             )""")
         conn.commit()
-        tables = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
-        assert "listings" in tables
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='listings'"
+        ).fetchone()
+        assert row is not None
         conn.close()
 
     def test_db_creates_comps_table(self, tmp_path):
@@ -184,8 +179,10 @@ class TestDatabaseInit:
                 count INTEGER, ts REAL
             )""")
         conn.commit()
-        tables = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
-        assert "comps" in tables
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='comps'"
+        ).fetchone()
+        assert row is not None
         conn.close()
 
     def test_db_insert_and_query_listing(self, smoke_db):
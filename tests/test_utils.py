@@ -8,7 +8,6 @@ import sqlite3
 
 # Ensure backend is on the path
 import sys
-import tempfile
 import time
 from pathlib import Path
 from unittest.mock import patch
@@ -27,12 +26,8 @@ from backend.utils import (
 )
 
 
-@pytest.fixture
-def db_with_data():
-    """Create a temporary database with sample data."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as f:
-        db_path = f.name
-
+def _create_tables(db_path: str) -> sqlite3.Connection:
+    """Create the listings and comps tables and return an open connection."""
     conn = sqlite3.connect(db_path)
     c = conn.cursor()
     c.execute("""
@@ -48,6 +43,13 @@ def db_with_data():
           count INTEGER, ts REAL
         )
     """)
+    return conn
+
+
+def _create_db_with_data(db_path: str) -> str:
+    """Create a database at *db_path* with sample data."""
+    conn = _create_tables(db_path)
+    c = conn.cursor()
 
     now = time.time()
     c.executemany(
@@ -68,40 +70,30 @@ def db_with_data():
     conn.commit()
     conn.close()
 
-    yield db_path
+    return db_path
 
-    if os.path.exists(db_path):
-        os.remove(db_path)
+
+@pytest.fixture(scope="module")
+def db_with_data(tmp_path_factory):
+    """Sample-data database shared by the module; tests must not modify it."""
+    return _create_db_with_data(str(tmp_path_factory.mktemp("utils") / "data.db"))
 
 
 @pytest.fixture
-def empty_db():
-    """Create an empty but initialized database."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as f:
-        db_path = f.name
+def fresh_db_with_data(tmp_path):
+    """Per-test sample-data database for tests that delete or change rows."""
+    return _create_db_with_data(str(tmp_path / "data.db"))
 
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS listings (
-          id INTEGER PRIMARY KEY AUTOINCREMENT,
-          source TEXT, url TEXT UNIQUE, title TEXT, price REAL,
-          currency TEXT, condition TEXT, ts REAL, meta_json TEXT
-        )
-    """)
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS comps (
-          key_title TEXT PRIMARY KEY, avg_price REAL, median_price REAL,
-          count INTEGER, ts REAL
-        )
-    """)
+
+@pytest.fixture(scope="module")
+def empty_db(tmp_path_factory):
+    """Create an empty but initialized database."""
+    db_path = str(tmp_path_factory.mktemp("utils") / "empty.db")
+    conn = _create_tables(db_path)
     conn.commit()
     conn.close()
 
-    yield db_path
-
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    return db_path
 
 
 class TestInspectDatabase:
@@ -150,47 +142,42 @@ class TestInspectDatabase:
 class TestCleanOldListings:
     """Tests for clean_old_listings function."""
 
-    def test_clean_removes_old_listings(self):
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as f:
-            db_path = f.name
-
-        try:
-            conn = sqlite3.connect(db_path)
-            c = conn.cursor()
-            c.execute("""
-                CREATE TABLE listings (
-                  id INTEGER PRIMARY KEY, source TEXT, url TEXT UNIQUE,
-                  title TEXT, price REAL, currency TEXT, condition TEXT, ts REAL, meta_json TEXT
-                )
-            """)
-            old_ts = time.time() - (60 * 86400)  # 60 days ago
-            now = time.time()
-            c.execute(
-                "INSERT INTO listings VALUES (1, 'test', 'http://old.com', 'Old Item', 10.0, 'USD', 'live', ?, '{}')",
-                (old_ts,),
-            )
-            c.execute(
-                "INSERT INTO listings VALUES (2, 'test', 'http://new.com', 'New Item', 20.0, 'USD', 'live', ?, '{}')",
-                (now,),
+    def test_clean_removes_old_listings(self, tmp_path):
+        db_path = str(tmp_path / "clean.db")
+
+        conn = sqlite3.connect(db_path)
+        c = conn.cursor()
+        c.execute("""
+            CREATE TABLE listings (
+              id INTEGER PRIMARY KEY, source TEXT, url TEXT UNIQUE,
+              title TEXT, price REAL, currency TEXT, condition TEXT, ts REAL, meta_json TEXT
             )
-            conn.commit()
-            conn.close()
-
-            removed = clean_old_listings(db_path, days=30)
-            assert removed == 1
-
-            # Verify the new item is still there
-            conn = sqlite3.connect(db_path)
-            remaining = conn.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
-            conn.close()
-            assert remaining == 1
-        finally:
-            if os.path.exists(db_path):
-                os.remove(db_path)
-
-    def test_clean_no_old_listings(self, db_with_data):
+        """)
+        old_ts = time.time() - (60 * 86400)  # 60 days ago
+        now = time.time()
+        c.execute(
+            "INSERT INTO listings VALUES (1, 'test', 'http://old.com', 'Old Item', 10.0, 'USD', 'live', ?, '{}')",
+            (old_ts,),
+        )
+        c.execute(
+            "INSERT INTO listings VALUES (2, 'test', 'http://new.com', 'New Item', 20.0, 'USD', 'live', ?, '{}')",
+            (now,),
+        )
+        conn.commit()
+        conn.close()
+
+        removed = clean_old_listings(db_path, days=30)
+        assert removed == 1
+
+        # Verify the new item is still there
+        conn = sqlite3.connect(db_path)
+        remaining = conn.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+        conn.close()
+        assert remaining == 1
+
+    def test_clean_no_old_listings(self, fresh_db_with_data):
         # All listings have current timestamps - should remove none
-        removed = clean_old_listings(db_with_data, days=0)
+        removed = clean_old_listings(fresh_db_with_data, days=0)
         # days=0 means cutoff is now, so all listings should be removed
         assert removed >= 0
 
@@ -202,22 +189,17 @@ class TestCleanOldListings:
 class TestExportDatabaseStats:
     """Tests for export_database_stats function."""
 
-    def test_export_creates_file(self, db_with_data):
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as f:
-            output_path = f.name
+    def test_export_creates_file(self, db_with_data, tmp_path):
+        output_path = str(tmp_path / "stats.json")
 
-        try:
-            result = export_database_stats(db_with_data, output_path)
-            assert result is True
-            assert Path(output_path).exists()
+        result = export_database_stats(db_with_data, output_path)
+        assert result is True
+        assert Path(output_path).exists()
 
-            with open(output_path) as f:
-                data = json.load(f)
-            assert "listings" in data
-            assert "comps" in data
-        finally:
-            if os.path.exists(output_path):
-                os.remove(output_path)
+        with open(output_path) as f:
+            data = json.load(f)
+        assert "listings" in data
+        assert "comps" in data
 
     def test_export_invalid_path(self, db_with_data):
         result = export_database_stats(db_with_data, "/nonexistent/dir/file.json")
@@ -227,27 +209,24 @@ class TestExportDatabaseStats:
 class TestBackupDatabase:
     """Tests for backup_database function."""
 
-    def test_backup_creates_file(self, db_with_data):
-        with tempfile.TemporaryDirectory() as backup_dir:
-            backup_path = backup_database(db_with_data, backup_dir=backup_dir)
-            assert os.path.exists(backup_path)
-            assert backup_path.endswith(".sqlite3")
+    def test_backup_creates_file(self, db_with_data, tmp_path):
+        backup_path = backup_database(db_with_data, backup_dir=str(tmp_path / "backups"))
+        assert os.path.exists(backup_path)
+        assert backup_path.endswith(".sqlite3")
 
-    def test_backup_default_dir(self, db_with_data):
+    def test_backup_default_dir(self, db_with_data, tmp_path):
         """Test backup with default directory."""
         with patch("backend.utils.Path.home") as mock_home:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                mock_home.return_value = Path(tmpdir)
-                backup_path = backup_database(db_with_data)
-                assert os.path.exists(backup_path)
-
-    def test_backup_preserves_data(self, db_with_data):
-        with tempfile.TemporaryDirectory() as backup_dir:
-            backup_path = backup_database(db_with_data, backup_dir=backup_dir)
-            conn = sqlite3.connect(backup_path)
-            count = conn.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
-            conn.close()
-            assert count == 3
+            mock_home.return_value = tmp_path
+            backup_path = backup_database(db_with_data)
+            assert os.path.exists(backup_path)
+
+    def test_backup_preserves_data(self, db_with_data, tmp_path):
+        backup_path = backup_database(db_with_data, backup_dir=str(tmp_path / "backups"))
+        conn = sqlite3.connect(backup_path)
+        count = conn.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+        conn.close()
+        assert count == 3
 
 
 class TestVacuumDatabase: